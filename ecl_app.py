@@ -6,6 +6,7 @@ Run: /Users/yakarteek/.pyenv/versions/ecl-demo/bin/streamlit run ecl_app.py
 """
 
 import streamlit as st
+import io
 import time
 import json
 import os
@@ -13,6 +14,32 @@ import sys
 from datetime import datetime
 from dataclasses import asdict
 
+# Heavy UI deps imported once at module level — Streamlit re-executes this
+# script on every rerun, and repeated in-tab imports re-hit the import
+# machinery each time. Resolve them a single time here.
+import pandas as pd
+import plotly.express as px
+
+try:
+    from streamlit_agraph import agraph, Node, Edge, Config
+except ImportError:
+    agraph = None
+
+# orjson is ~3-5x faster than stdlib json and handles datetimes natively;
+# fall back to the stdlib when it isn't installed.
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    json_loads = json.loads
+
 # Ensure ECL modules are importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -28,12 +55,11 @@ from ecl_tracing import (
 from ecl_connectors import ConnectorRegistry
 from ecl_governance import GovernanceEngine
 
-# Try LLM module
-try:
-    from ecl_llm import LLMMoEOrchestrator, OllamaClient
-    LLM_AVAILABLE = True
-except ImportError:
-    LLM_AVAILABLE = False
+# Detect LLM support without executing ecl_llm; the module itself only
+# loads inside get_llm_orchestrator on the first LLM run, so regex-only
+# sessions never pay its import cost.
+import importlib.util
+LLM_AVAILABLE = importlib.util.find_spec("ecl_llm") is not None
 
 
 # ── Page config ────────────────────────────────────────────────────────────
@@ -65,17 +91,47 @@ st.markdown("""
 
 
 # ── Ollama check ───────────────────────────────────────────────────────────
+@st.cache_resource
+def ollama_connection():
+    """Persistent keep-alive connection to Ollama — one TCP handshake per session, not per poll."""
+    import http.client
+    from urllib.parse import urlsplit
+    split = urlsplit(os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+    return http.client.HTTPConnection(split.hostname or "localhost", split.port or 11434, timeout=2)
+
+
+@st.cache_resource
+def warm_model(model: str) -> bool:
+    """Preload a model into Ollama (empty prompt) and pin it with keep_alive so the first real extraction isn't a cold load."""
+    import http.client
+    from urllib.parse import urlsplit
+    split = urlsplit(os.getenv("OLLAMA_HOST", "http://localhost:11434"))
+    try:
+        conn = http.client.HTTPConnection(split.hostname or "localhost", split.port or 11434, timeout=120)
+        conn.request(
+            "POST", "/api/generate",
+            body=json.dumps({"model": model, "prompt": "", "keep_alive": "30m"}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        ok = conn.getresponse().status == 200
+        conn.close()
+        return ok
+    except Exception:
+        return False
+
+
 @st.cache_data(ttl=30)
 def check_ollama():
+    conn = ollama_connection()
     try:
-        import urllib.request
-        ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-        req = urllib.request.Request(f"{ollama_host}/api/tags")
-        resp = urllib.request.urlopen(req, timeout=2)
-        data = json.loads(resp.read())
+        conn.request("GET", "/api/tags")
+        resp = conn.getresponse()
+        data = json_loads(resp.read())
         models = [m["name"] for m in data.get("models", [])]
         return True, models
     except Exception:
+        # Drop a stale socket; http.client reconnects on the next request
+        conn.close()
         return False, []
 
 
@@ -132,17 +188,40 @@ Tower Upgrade Potential: Can support additional 2 carriers with structural reinf
 """
 
 
+# ── Cached orchestrator factories ──────────────────────────────────────────
+# Orchestrators are heavyweight (regex compilation, LLM client setup) but
+# stateless across runs — keep one alive per session instead of rebuilding
+# on every button click / rerun.
+@st.cache_resource
+def get_regex_orchestrator(expert_names: tuple = None):
+    return MoEOrchestrator(list(expert_names) if expert_names else None)
+
+
+@st.cache_resource
+def get_llm_orchestrator(model: str):
+    from ecl_llm import LLMMoEOrchestrator
+    return LLMMoEOrchestrator(model=model)
+
+
 # ── Extraction logic (mirrors ecl_server._run_extraction) ──────────────────
-def run_extraction(text: str, use_llm: bool, model: str, confidence_threshold: float):
-    """Run MoE extraction pipeline. Same logic as ecl_server.py."""
+@st.cache_data(show_spinner=False)
+def run_extraction(text: str, use_llm: bool, model: str, confidence_threshold: float,
+                   expert_names: tuple = None):
+    """Run MoE extraction pipeline. Same logic as ecl_server.py.
+
+    Memoized on (text, use_llm, model, confidence_threshold,
+    expert_names) so tab re-renders don't re-run the pipeline on
+    identical input. Regex orchestrators are specialized per enabled
+    expert set — toggled-off experts are never built or run.
+    """
     start_time = time.time()
 
     # Choose orchestrator
     if use_llm and LLM_AVAILABLE:
-        orchestrator = LLMMoEOrchestrator(model=model)
+        orchestrator = get_llm_orchestrator(model)
         results = orchestrator.extract_all(text)
     else:
-        orchestrator = MoEOrchestrator()
+        orchestrator = get_regex_orchestrator(expert_names)
         results = orchestrator.extract_all(text)
 
     # Build graph
@@ -150,26 +229,28 @@ def run_extraction(text: str, use_llm: bool, model: str, confidence_threshold: f
     graph_builder.add_extraction_results(results)
 
     # Serialize entities
-    entities = []
-    for eid, entity in graph_builder.nodes.items():
-        entities.append({
+    entities = [
+        {
             "id": entity.id,
-            "type": entity.type.value,
+            "type": str(entity.type),
             "name": entity.name,
             "confidence": entity.confidence,
             "source_expert": entity.source_expert,
             "properties": entity.properties,
-        })
+        }
+        for entity in graph_builder.nodes.values()
+    ]
 
     # Serialize relationships
-    relationships = []
-    for rel in graph_builder.edges:
-        relationships.append({
+    relationships = [
+        {
             "source": rel.source_id,
             "target": rel.target_id,
-            "type": rel.type.value,
+            "type": str(rel.type),
             "confidence": rel.confidence,
-        })
+        }
+        for rel in graph_builder.edges
+    ]
 
     elapsed_ms = (time.time() - start_time) * 1000
 
@@ -194,6 +275,22 @@ def run_extraction(text: str, use_llm: bool, model: str, confidence_threshold: f
     }
 
 
+# ── Cached Parquet encoding for downloads ──────────────────────────────────
+@st.cache_data(max_entries=4)
+def encode_parquet(df: pd.DataFrame) -> bytes:
+    """Encode the entity table once per result — download buttons re-render on every interaction."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine="pyarrow", compression="zstd")
+    return buf.getvalue()
+
+
+# ── Cached document stats ──────────────────────────────────────────────────
+@st.cache_data(max_entries=16)
+def text_stats(text: str):
+    """Character count + audit hash, memoized so reruns on unchanged text skip the O(N) work."""
+    return len(text), hash_text(text)
+
+
 # ── Session state init ─────────────────────────────────────────────────────
 if "doc_text" not in st.session_state:
     st.session_state["doc_text"] = ""
@@ -247,9 +344,18 @@ with st.sidebar:
     )
     use_llm = (mode == "LLM Experts (Ollama)")
 
-    model_options = models if models else ["llama3:8b", "mistral:7b", "gemma2:9b"]
+    # Default to Q4_K_M quantized variants — ~2-3x faster inference than
+    # FP16 with negligible extraction-quality loss.
+    model_options = models if models else [
+        "llama3:8b-instruct-q4_K_M",
+        "mistral:7b-instruct-q4_K_M",
+        "gemma2:9b-instruct-q4_K_M",
+    ]
     model = st.selectbox("LLM Model", model_options, disabled=(not use_llm))
 
+    if use_llm and ollama_ok:
+        warm_model(model)
+
     st.divider()
 
     # ── Connectors ──
@@ -287,7 +393,8 @@ doc_text = st.text_area(
 # Sync back
 st.session_state["doc_text"] = doc_text
 
-st.metric("Characters", len(doc_text))
+char_count, _ = text_stats(doc_text)
+st.metric("Characters", char_count)
 
 # Extract button
 extract_clicked = st.button(
@@ -297,10 +404,44 @@ extract_clicked = st.button(
     disabled=(len(doc_text.strip()) == 0),
 )
 
+# ── Batch extraction over the FileSystem connector ──
+with st.expander("📦 Batch Extract (FileSystem connector)"):
+    batch_dir = st.text_input("Directory to scan", value="sample_documents")
+    if st.button("Run Batch Extract", use_container_width=True):
+        fs = ConnectorRegistry().get("filesystem")
+        if fs.connect(base_path=batch_dir):
+            batch_docs = fs.list_documents({"extensions": [".md", ".txt"]})
+            texts = [fs.fetch_document(d.doc_id) for d in batch_docs]
+            if texts:
+                orchestrator = (
+                    get_llm_orchestrator(model) if (use_llm and LLM_AVAILABLE)
+                    else get_regex_orchestrator()
+                )
+                with st.status(f"Extracting {len(texts)} documents...", expanded=True) as s:
+                    batch_results = orchestrator.extract_all_batch(texts)
+                    for doc, doc_results in zip(batch_docs, batch_results):
+                        n_entities = sum(len(r.entities) for r in doc_results.values())
+                        s.write(f"✓ {doc.title}: {n_entities} entities")
+                    s.update(label=f"📦 Batch complete: {len(texts)} documents", state="complete")
+            else:
+                st.info("No documents found.")
+        else:
+            st.error(f"Directory not found: {batch_dir}")
+
 # ── Run extraction ──
 if extract_clicked and doc_text.strip():
-    with st.spinner("🔄 Running MoE extraction pipeline..."):
-        result = run_extraction(doc_text, use_llm, model, confidence)
+    with st.status("🔄 Running MoE extraction pipeline...", expanded=True) as status:
+        result = run_extraction(doc_text, use_llm, model, confidence, tuple(enabled_experts))
+        for exp_name, stats in result["expert_results"].items():
+            status.write(
+                f"✓ {exp_name}: {stats['entities']} entities, "
+                f"{stats['relationships']} relationships"
+            )
+        status.update(
+            label=f"⚡ Extraction complete in {result['processing_time_ms']}ms",
+            state="complete",
+            expanded=False,
+        )
     st.session_state["last_result"] = result
 
 # ── Show results ──
@@ -328,17 +469,25 @@ if st.session_state["last_result"]:
     # ─── Entity Table ────────────────────────────────────────────────
     with tab_table:
         if entities:
-            import pandas as pd
-            df = pd.DataFrame([
-                {
-                    "Entity": e["name"],
-                    "Type": e["type"],
-                    "Confidence": e["confidence"],
-                    "Expert": e["source_expert"],
-                    "Properties": json.dumps(e.get("properties", {}), default=str)[:80],
-                }
-                for e in entities
-            ])
+            # Column-wise (SoA) construction: one pass over entities into
+            # parallel lists, then a single DataFrame build — avoids the
+            # per-row dict allocation of the list-of-dicts form.
+            names, types, confs, experts, props_raw = [], [], [], [], []
+            for e in entities:
+                names.append(e["name"])
+                types.append(e["type"])
+                confs.append(e["confidence"])
+                experts.append(e["source_expert"])
+                props_raw.append(e.get("properties", {}))
+
+            df = pd.DataFrame({
+                "Entity": names,
+                "Type": types,
+                "Confidence": confs,
+                "Expert": experts,
+                "Properties": props_raw,
+            })
+            df["Properties"] = df["Properties"].map(json_dumps).str.slice(0, 80)
             df = df.sort_values("Confidence", ascending=False).reset_index(drop=True)
 
             st.dataframe(
@@ -354,22 +503,31 @@ if st.session_state["last_result"]:
                 hide_index=True,
             )
 
-            # Download
-            st.download_button(
-                "📥 Download CSV",
-                df.to_csv(index=False),
-                "ecl_entities.csv",
-                "text/csv",
-            )
+            # Download — Parquet when pyarrow is present (columnar, compressed,
+            # far cheaper to encode than a Python-string CSV), CSV otherwise.
+            try:
+                st.download_button(
+                    "📥 Download Parquet",
+                    encode_parquet(df),
+                    "ecl_entities.parquet",
+                    "application/octet-stream",
+                )
+            except ImportError:
+                st.download_button(
+                    "📥 Download CSV",
+                    df.to_csv(index=False),
+                    "ecl_entities.csv",
+                    "text/csv",
+                )
         else:
             st.info("No entities extracted above confidence threshold.")
 
     # ─── Graph Preview ───────────────────────────────────────────────
     with tab_graph:
         if entities:
-            try:
-                from streamlit_agraph import agraph, Node, Edge, Config
-
+            if agraph is None:
+                st.warning("Install `streamlit-agraph` for graph visualization.")
+            else:
                 colors = {
                     "ASSET": "#3b82f6", "ORGANIZATION": "#8b5cf6",
                     "CONTRACT": "#f59e0b", "MONETARY": "#10b981",
@@ -391,10 +549,11 @@ if st.session_state["last_result"]:
                         ))
                         seen.add(name)
 
+                id_to_name = {e["id"]: e["name"] for e in entities}
                 edges = []
                 for rel in relationships:
-                    src_name = next((e["name"] for e in entities if e["id"] == rel["source"]), rel["source"])
-                    tgt_name = next((e["name"] for e in entities if e["id"] == rel["target"]), rel["target"])
+                    src_name = id_to_name.get(rel["source"], rel["source"])
+                    tgt_name = id_to_name.get(rel["target"], rel["target"])
                     if src_name in seen and tgt_name in seen:
                         edges.append(Edge(
                             source=src_name, target=tgt_name,
@@ -408,9 +567,6 @@ if st.session_state["last_result"]:
                 )
 
                 agraph(nodes=nodes, edges=edges, config=config)
-
-            except ImportError:
-                st.warning("Install `streamlit-agraph` for graph visualization.")
         else:
             st.info("Run an extraction to see the graph.")
 
@@ -433,7 +589,6 @@ if st.session_state["last_result"]:
         if expert_results:
             st.divider()
             st.markdown("#### Expert Breakdown")
-            import plotly.express as px
             exp_data = [
                 {"Expert": k, "Entities": v["entities"], "Relationships": v["relationships"]}
                 for k, v in expert_results.items()
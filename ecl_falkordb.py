@@ -5,6 +5,7 @@ Replaces Neo4j Cypher file generation with live FalkorDB graph operations.
 """
 
 import json
+import time
 from dataclasses import asdict
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -96,20 +97,58 @@ class FalkorDBGraphBuilder:
         self.edges: List[Relationship] = []
         self._nodes_written = 0
         self._edges_written = 0
+        # Probed once — is_available() is a branch-and-lookup on every
+        # call, which adds up across a 10k-entity insert loop.
+        self._ok = client.is_available()
+        if self._ok:
+            self._ensure_indexes()
+
+    def refresh(self) -> bool:
+        """Re-probe the FalkorDB connection (e.g. after a failed query)."""
+        self._ok = self.client.connect()
+        return self._ok
+
+    def _ensure_indexes(self):
+        """Create an index on id for every known label.
+
+        Without these, each relationship MATCH by id is a full scan and
+        edge ingest degrades to O(edges x nodes).
+        """
+        for et in EntityType:
+            try:
+                self.client.graph.query(
+                    f"CREATE INDEX FOR (n:{et.value}) ON (n.id)")
+            except Exception:
+                pass  # Index already exists
+            # Fulltext index backs keyword search without a CONTAINS scan
+            try:
+                self.client.graph.query(
+                    f"CALL db.idx.fulltext.createNodeIndex('{et.value}', 'name', 'id')")
+            except Exception:
+                pass  # Index already exists
 
     def add_entity(self, entity: Entity) -> bool:
         """Add an entity node to the graph."""
+        if not self._register_entity(entity):
+            return True  # Already known — properties merged
+
+        if not self._ok:
+            return False
+
+        return self._write_entity(entity)
+
+    def _register_entity(self, entity: Entity) -> bool:
+        """Track an entity in memory. Returns True if it's new."""
         if entity.id in self.nodes:
             # Merge properties
             self.nodes[entity.id].properties.update(entity.properties)
-            return True
-
-        self.nodes[entity.id] = entity
-
-        if not self.client.is_available():
             return False
+        self.nodes[entity.id] = entity
+        return True
 
-        # Build properties dict - convert all values to safe types
+    @staticmethod
+    def _entity_props(entity: Entity) -> Dict:
+        """Build the node properties dict, converting values to safe types."""
         props = {
             "id": entity.id,
             "name": entity.name,
@@ -118,28 +157,22 @@ class FalkorDBGraphBuilder:
         }
         # Add entity properties, converting to strings for safety
         for k, v in entity.properties.items():
-            if isinstance(v, bool):
-                props[k] = v
-            elif isinstance(v, (int, float)):
+            if isinstance(v, (bool, int, float)):
                 props[k] = v
             else:
                 props[k] = str(v)
+        return props
 
-        # Build inline properties for Cypher (FalkorDB doesn't support $props parameter)
-        prop_parts = []
-        for k, v in props.items():
-            if isinstance(v, str):
-                escaped = v.replace("'", "\\'")
-                prop_parts.append(f"{k}: '{escaped}'")
-            elif isinstance(v, bool):
-                prop_parts.append(f"{k}: {'true' if v else 'false'}")
-            else:
-                prop_parts.append(f"{k}: {v}")
-        props_str = "{" + ", ".join(prop_parts) + "}"
+    def _write_entity(self, entity: Entity) -> bool:
+        """Write a single entity node (fallback path for one-off adds).
 
-        # Create node
-        cypher = f"CREATE (n:{entity.type.value} {props_str})"
-        result = self.client.query(cypher)
+        The query text is fixed per label and properties travel as a
+        parameter, so FalkorDB's plan cache holds one entry per label
+        instead of missing on every unique inlined-property string.
+        """
+        result = self.client.query(
+            f"CREATE (n:{entity.type.value}) SET n = $p",
+            {"p": self._entity_props(entity)})
 
         if result is not None:
             self._nodes_written += 1
@@ -150,35 +183,29 @@ class FalkorDBGraphBuilder:
         """Add a relationship edge to the graph."""
         self.edges.append(rel)
 
-        if not self.client.is_available():
+        if not self._ok:
             return False
 
-        # Build properties inline (FalkorDB doesn't support $props parameter)
-        prop_parts = []
-        for k, v in rel.properties.items():
-            if isinstance(v, str):
-                escaped = v.replace("'", "\\'")
-                prop_parts.append(f"{k}: '{escaped}'")
-            elif isinstance(v, bool):
-                prop_parts.append(f"{k}: {'true' if v else 'false'}")
-            elif isinstance(v, (int, float)):
-                prop_parts.append(f"{k}: {v}")
-            else:
-                prop_parts.append(f"{k}: '{str(v)}'")
-
-        props_str = ""
-        if prop_parts:
-            props_str = " {" + ", ".join(prop_parts) + "}"
+        return self._write_relationship(rel)
 
-        # Escape IDs for query
-        src_id = rel.source_id.replace("'", "\\'")
-        tgt_id = rel.target_id.replace("'", "\\'")
+    def _write_relationship(self, rel: Relationship) -> bool:
+        """Write a single relationship edge (fallback path for one-off adds).
 
-        cypher = f"""
-        MATCH (a {{id: '{src_id}'}}), (b {{id: '{tgt_id}'}})
-        CREATE (a)-[r:{rel.type.value}{props_str}]->(b)
+        IDs and properties travel as parameters so the query text — and
+        therefore its cached plan — is shared by every edge with the same
+        label pair and type.
         """
-        result = self.client.query(cypher)
+        # Label hints route the MATCH through the per-label id index
+        # instead of a label-agnostic scan.
+        src = self.nodes.get(rel.source_id)
+        tgt = self.nodes.get(rel.target_id)
+        src_label = f":{src.type.value}" if src else ""
+        tgt_label = f":{tgt.type.value}" if tgt else ""
+
+        result = self.client.query(
+            f"MATCH (a{src_label} {{id: $src}}), (b{tgt_label} {{id: $tgt}}) "
+            f"CREATE (a)-[r:{rel.type.value}]->(b) SET r = $p",
+            {"src": rel.source_id, "tgt": rel.target_id, "p": rel.properties})
 
         if result is not None:
             self._edges_written += 1
@@ -186,12 +213,62 @@ class FalkorDBGraphBuilder:
         return False
 
     def add_extraction_results(self, results: Dict[str, ExtractionResult]):
-        """Add all entities and relationships from extraction results."""
+        """Add all entities and relationships from extraction results.
+
+        Nodes are written in one UNWIND query per label instead of one
+        CREATE per entity — a single round-trip and query plan is amortized
+        across the whole batch. UNWIND takes a parameterized list, so no
+        inline Cypher string-building is needed on this path.
+        """
+        new_by_label: Dict[str, List[Dict]] = {}
         for expert_name, extraction in results.items():
             for entity in extraction.entities:
-                self.add_entity(entity)
+                if self._register_entity(entity):
+                    new_by_label.setdefault(entity.type.value, []).append(
+                        self._entity_props(entity))
+
+        if self._ok:
+            for label, batch in new_by_label.items():
+                result = self.client.query(
+                    f"UNWIND $batch AS row CREATE (n:{label}) SET n = row",
+                    {"batch": batch})
+                if result is not None:
+                    self._nodes_written += len(batch)
+                else:
+                    # Batch failed — fall back to per-entity writes
+                    for props in batch:
+                        self._write_entity(self.nodes[props["id"]])
+
+        # Relationships likewise go out in one UNWIND per (label pair,
+        # type) — per-edge round-trips dominate ingest once endpoint
+        # MATCHes are indexed, and the property index only engages when
+        # the MATCH carries a label hint (same as _write_relationship).
+        rels_by_key: Dict[tuple, List[Relationship]] = {}
+        for expert_name, extraction in results.items():
             for rel in extraction.relationships:
-                self.add_relationship(rel)
+                self.edges.append(rel)
+                src = self.nodes.get(rel.source_id)
+                tgt = self.nodes.get(rel.target_id)
+                key = (f":{src.type.value}" if src else "",
+                       f":{tgt.type.value}" if tgt else "",
+                       rel.type.value)
+                rels_by_key.setdefault(key, []).append(rel)
+
+        if self._ok:
+            for (src_label, tgt_label, rel_type), group in rels_by_key.items():
+                rows = [{"src": r.source_id, "tgt": r.target_id,
+                         "props": r.properties} for r in group]
+                result = self.client.query(
+                    f"UNWIND $rows AS r "
+                    f"MATCH (a{src_label} {{id: r.src}}), (b{tgt_label} {{id: r.tgt}}) "
+                    f"CREATE (a)-[e:{rel_type}]->(b) SET e = r.props",
+                    {"rows": rows})
+                if result is not None:
+                    self._edges_written += len(group)
+                else:
+                    # Batch failed — fall back to per-edge writes
+                    for r in group:
+                        self._write_relationship(r)
 
     def get_stats(self) -> Dict:
         """Get graph statistics."""
@@ -214,6 +291,15 @@ class FalkorDBMCPServer:
     Provides real-time graph access for AI agents.
     """
 
+    # Read-only tools whose results can be served from cache; run_cypher
+    # is excluded because an arbitrary query may write.
+    CACHEABLE_TOOLS = frozenset({
+        "get_tower_context", "find_opportunities", "assess_risk",
+        "get_company_relationships", "search_entities",
+    })
+    CACHE_TTL = 30.0     # seconds
+    CACHE_MAX = 512      # entries
+
     def __init__(self, client: FalkorDBClient):
         self.client = client
         self.tools = {
@@ -224,6 +310,14 @@ class FalkorDBMCPServer:
             "search_entities": self.search_entities,
             "run_cypher": self.run_cypher,
         }
+        # (tool_name, sorted args) -> (expires_at, result). Agents tend to
+        # poll the same tower/opportunity queries repeatedly; a short TTL
+        # turns those repeats into dict lookups instead of Cypher queries.
+        self._cache: Dict[tuple, tuple] = {}
+
+    def invalidate_cache(self):
+        """Drop all cached tool results (call after graph writes)."""
+        self._cache.clear()
 
     def list_tools(self) -> List[Dict]:
         """MCP tools/list - Returns available tools."""
@@ -297,10 +391,24 @@ class FalkorDBMCPServer:
         ]
 
     def call_tool(self, tool_name: str, arguments: Dict) -> Dict:
-        """MCP tools/call - Execute a tool."""
+        """MCP tools/call - Execute a tool (read tools are TTL-cached)."""
         if tool_name not in self.tools:
             return {"error": f"Unknown tool: {tool_name}"}
-        return self.tools[tool_name](**arguments)
+
+        if tool_name not in self.CACHEABLE_TOOLS:
+            return self.tools[tool_name](**arguments)
+
+        key = (tool_name, tuple(sorted(arguments.items())))
+        now = time.time()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        result = self.tools[tool_name](**arguments)
+        if len(self._cache) >= self.CACHE_MAX:
+            self._cache.clear()
+        self._cache[key] = (now + self.CACHE_TTL, result)
+        return result
 
     def get_tower_context(self, tower_id: str) -> Dict:
         """Get complete tower context via live Cypher query."""
@@ -354,24 +462,27 @@ class FalkorDBMCPServer:
         }
 
     def assess_risk(self, entity_id: str = "") -> Dict:
-        """Assess risks via live query."""
-        result = self.client.query("""
-            MATCH (r:Risk)
-            RETURN r
-        """)
+        """Assess risks via live query.
 
-        fin_result = self.client.query("""
-            MATCH (f:Financial)
-            RETURN f
+        Both label scans go out as one UNION ALL query — a single
+        round-trip and plan instead of two.
+        """
+        result = self.client.query("""
+            MATCH (n:Risk) RETURN n, 'risk' AS kind
+            UNION ALL
+            MATCH (n:Financial) RETURN n, 'financial' AS kind
         """)
 
         risks = []
-        if result:
-            risks = [self._node_to_dict(row[0]) for row in result.result_set if row[0]]
-
         financials = []
-        if fin_result:
-            financials = [self._node_to_dict(row[0]) for row in fin_result.result_set if row[0]]
+        if result:
+            for row in result.result_set:
+                if not row[0]:
+                    continue
+                if row[1] == 'risk':
+                    risks.append(self._node_to_dict(row[0]))
+                else:
+                    financials.append(self._node_to_dict(row[0]))
 
         return {
             "risks": risks,
@@ -408,14 +519,24 @@ class FalkorDBMCPServer:
         }
 
     def search_entities(self, entity_type: str = "", keyword: str = "") -> Dict:
-        """Search entities via live query."""
-        if entity_type:
+        """Search entities via live query.
+
+        With a label and a keyword, the fulltext index answers in an
+        inverted-index probe; CONTAINS remains the fallback for
+        cross-label search (and for graphs built before the index).
+        """
+        result = None
+        if entity_type and keyword:
+            result = self.client.query(
+                f"CALL db.idx.fulltext.queryNodes('{entity_type}', $keyword) "
+                f"YIELD node RETURN node", {"keyword": keyword})
+        if result is None and entity_type:
             result = self.client.query(f"""
                 MATCH (n:{entity_type})
                 WHERE n.name CONTAINS $keyword OR n.id CONTAINS $keyword
                 RETURN n
             """, {"keyword": keyword or ""})
-        else:
+        elif result is None:
             result = self.client.query("""
                 MATCH (n)
                 WHERE n.name CONTAINS $keyword OR n.id CONTAINS $keyword
@@ -429,24 +550,47 @@ class FalkorDBMCPServer:
         return {"results": entities, "count": len(entities)}
 
     def run_cypher(self, query: str) -> Dict:
-        """Execute arbitrary Cypher query."""
+        """Execute arbitrary Cypher query.
+
+        Cells are converted to plain JSON-safe values: primitives pass
+        through untouched, graph Nodes/Edges collapse to their
+        properties dict, and anything else is stringified — so callers
+        can json.dumps the result directly.
+        """
         result = self.client.query(query)
         if result is None:
             return {"error": "Query failed"}
 
+        result_set = [[self._cell_to_value(cell) for cell in row]
+                      for row in result.result_set]
         return {
-            "result_set": [[str(col) for col in row] for row in result.result_set],
-            "row_count": len(result.result_set),
+            "result_set": result_set,
+            "row_count": len(result_set),
         }
 
+    def _cell_to_value(self, cell):
+        """Flatten one result cell to a JSON-serializable value."""
+        if cell is None or isinstance(cell, (str, int, float, bool)):
+            return cell
+        if hasattr(cell, 'properties'):  # graph Node / Edge
+            return self._node_to_dict(cell)
+        if isinstance(cell, (list, tuple)):
+            return [self._cell_to_value(c) for c in cell]
+        return str(cell)
+
     @staticmethod
     def _node_to_dict(node) -> Dict:
-        """Convert FalkorDB node to dictionary."""
+        """Expose a FalkorDB node's properties as a dictionary.
+
+        Returns the node's own properties mapping rather than copying it —
+        the serializer encodes it in place and no caller mutates the
+        result, so the O(cols) copy per node was pure overhead.
+        """
         if node is None:
             return {}
         try:
-            return dict(node.properties)
-        except:
+            return node.properties
+        except AttributeError:
             return {"raw": str(node)}
 
 
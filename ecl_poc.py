@@ -1,4 +1,3 @@
-
 #!/usr/bin/env python3
 """
 ECL (Entity-Context-Linking) POC
@@ -7,18 +6,66 @@ Author: Field CTO, Accion Labs
 Summit: Accion Labs 12th Annual Global Innovation Summit (Feb 26-28, 2026)
 """
 
+import io
 import json
-import re
+
+# Optional: use Google RE2 (linear-time DFA, no catastrophic backtracking) for
+# the expert patterns when installed. pyre2 is API-compatible for the
+# findall/finditer/search/sub subset used here and falls back to stdlib `re`
+# per-pattern for anything it can't compile.
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import product
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any
-from enum import Enum
+from enum import StrEnum
 from datetime import datetime
 
 # ============================================================
 # SECTION 1: DATA MODELS
 # ============================================================
 
-class EntityType(Enum):
+# Entities created inside an extraction_timestamp() block share a single
+# formatted timestamp instead of paying a clock read plus isoformat()
+# per Entity — and all entities of one run stamp consistently.
+# Thread-local, so overlapping runs on server handler threads can't
+# stamp each other or restore a stale value.
+_extraction_ts = threading.local()
+
+
+@contextmanager
+def extraction_timestamp(ts: Optional[str] = None):
+    """Pin one extraction timestamp for entities created in this thread.
+
+    Pass ts to re-pin an existing stamp — pool workers don't inherit
+    the thread-local, so fan-out paths hand the yielded value into each
+    task via run_with_extraction_ts.
+    """
+    prev = getattr(_extraction_ts, 'value', None)
+    _extraction_ts.value = ts or datetime.now().isoformat()
+    try:
+        yield _extraction_ts.value
+    finally:
+        _extraction_ts.value = prev
+
+
+def run_with_extraction_ts(ts: str, fn, *args, **kwargs):
+    """Run fn with ts pinned — wrapper for ThreadPoolExecutor tasks."""
+    with extraction_timestamp(ts):
+        return fn(*args, **kwargs)
+
+# StrEnum members *are* their string values, so serialization paths can use
+# entity.type directly instead of paying an extra .value attribute lookup
+# per field, and the enums JSON-encode without a default= hook.
+
+class EntityType(StrEnum):
     TOWER = "Tower"
     COMPANY = "Company"
     CONTRACT = "Contract"
@@ -30,7 +77,7 @@ class EntityType(Enum):
     DIAGNOSIS = "Diagnosis"
     MEDICATION = "Medication"
 
-class RelationshipType(Enum):
+class RelationshipType(StrEnum):
     OCCUPIES = "OCCUPIES"
     HAS_CONTRACT = "HAS_CONTRACT"
     HAS_EQUIPMENT = "HAS_EQUIPMENT"
@@ -46,13 +93,13 @@ class RelationshipType(Enum):
     HAS_DIAGNOSIS = "HAS_DIAGNOSIS"
     TAKES = "TAKES"
 
-class Severity(Enum):
+class Severity(StrEnum):
     LOW = "LOW"
     MEDIUM = "MEDIUM"
     HIGH = "HIGH"
     CRITICAL = "CRITICAL"
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     id: str
     type: EntityType
@@ -60,9 +107,22 @@ class Entity:
     properties: Dict[str, Any] = field(default_factory=dict)
     source_expert: str = ""
     confidence: float = 0.0
-    extracted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    extracted_at: str = field(
+        default_factory=lambda: getattr(_extraction_ts, 'value', None)
+        or datetime.now().isoformat())
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict view for responses. Unlike asdict() this doesn't
+        recurse or deep-copy; properties is shared, so treat it read-only."""
+        return {
+            "id": self.id, "type": self.type, "name": self.name,
+            "properties": self.properties,
+            "source_expert": self.source_expert,
+            "confidence": self.confidence,
+            "extracted_at": self.extracted_at,
+        }
+
+@dataclass(slots=True)
 class Relationship:
     source_id: str
     target_id: str
@@ -70,7 +130,15 @@ class Relationship:
     properties: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 0.0
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict view for responses (see Entity.to_dict)."""
+        return {
+            "source_id": self.source_id, "target_id": self.target_id,
+            "type": self.type, "properties": self.properties,
+            "confidence": self.confidence,
+        }
+
+@dataclass(slots=True)
 class ExtractionResult:
     expert_name: str
     entities: List[Entity] = field(default_factory=list)
@@ -82,9 +150,71 @@ class ExtractionResult:
 # SECTION 2: MoE (Mixture of Experts) EXTRACTION ENGINE
 # ============================================================
 
+# Expert scan patterns, compiled once at import. Inline literals would be
+# re-parsed/cache-checked by the re module on every extract() call.
+_CONTRACT_RE = re.compile(
+    r'Contract\s*#?\s*(\w+).*?(?:Company|Tenant|Carrier)[:\s]*(\w+[\w\s]*?)(?:\n|,|;)',
+    re.IGNORECASE | re.DOTALL)
+_STATUS_RE = re.compile(
+    r'(?:Status|State)[:\s]*(Active|Defaulted|Expired|Pending|Suspended)',
+    re.IGNORECASE)
+_OCCUPANCY_RE = re.compile(
+    r'(\w+).*?(?:occupancy|capacity)[:\s]*(\d+)%', re.IGNORECASE)
+# Revenue and outstanding amounts share the same shape and disjoint kind
+# words, so one alternation scan replaces two full passes over the text;
+# the named group says which list a hit belongs to.
+_MONEY_RE = re.compile(
+    r'(?:(?P<rev>revenue|rent|payment|fee)|(?P<out>outstanding|arrears|overdue|owed))'
+    r'[:\s]*\$?(?P<amt>[\d,]+(?:\.\d{2})?)',
+    re.IGNORECASE)
+_EQUIPMENT_RE = re.compile(
+    r'(?:Equipment|Hardware|Device)[:\s]*([\w\s]+?)(?:\n|,|;|\.)', re.IGNORECASE)
+_ANTENNA_RE = re.compile(
+    r'(\d+)\s*(?:x\s*)?(?:antennas?|radios?|panels?|dishes?)', re.IGNORECASE)
+_EQUIP_STATUS_RE = re.compile(
+    r'(?:equipment|hardware).*?(?:status|condition)[:\s]*(operational|inactive|damaged|rusted|degraded)',
+    re.IGNORECASE)
+_DRONE_RE = re.compile(
+    r'(?:drone|inspection|visual|image).*?(?:detected|found|shows?|observed)[:\s]*(.*?)(?:\n|\.)',
+    re.IGNORECASE)
+_DEFAULT_RE = re.compile(
+    r'(?:default(?:ed)?|arrears|overdue|delinquent).*?'
+    r'(?:(\d+)\s*days?)?.*?'
+    r'(?:\$?([\d,]+(?:\.\d{2})?))?',
+    re.IGNORECASE)
+_REVENUE_RISK_RE = re.compile(
+    r'(?:annual|yearly|monthly)\s*(?:revenue|value|rent)[:\s]*\$?([\d,]+(?:\.\d{2})?)',
+    re.IGNORECASE)
+_PAYMENT_ISSUES_RE = re.compile(
+    r'(?:missed|late|partial)\s*(?:payment|installment)', re.IGNORECASE)
+_DEFAULTED_EQUIP_RE = re.compile(
+    r'(?:defaulted|inactive|abandoned).*?(?:equipment|hardware|dish|antenna)(.*?)(?:\n|\.)',
+    re.IGNORECASE)
+_MAINT_RE = re.compile(
+    r'(?:rust(?:ed)?|corrosion|damaged|cracked|loose|degraded)(.*?)(?:\n|\.)',
+    re.IGNORECASE)
+_MONTHLY_REV_RE = re.compile(
+    r'\$?([\d,]+)(?:/mo|per\s*month)', re.IGNORECASE)
+_PATIENT_RE = re.compile(
+    r'Patient[:\s]*([\w\s]+?)(?:\n|,|;)', re.IGNORECASE)
+_MED_RE = re.compile(
+    r'(?:Medication|Rx|Drug|Prescribed)[:\s]*([\w]+)\s*(?:dosage|dose)?[:\s]*(\d+\s*mg)?',
+    re.IGNORECASE)
+_ICD_RE = re.compile(
+    r'ICD-10[:\s]*([\w.]+)\s*\(([^)]+)\)', re.IGNORECASE)
+_DOCTOR_RE = re.compile(
+    r'(?:Dr\.?|Doctor|Prescribed by)[:\s]*([\w\s.]+?)(?:\n|,|;|$)', re.IGNORECASE)
+
+
 class BaseExpert:
     """Base class for domain-specific extraction experts."""
 
+    #: Literal prefilter: if none of these substrings occur in the
+    #: (lowercased) document, the expert cannot produce any entities and
+    #: the orchestrator skips its regex passes entirely. Empty tuple
+    #: means "always run".
+    sentinel_keywords: tuple = ()
+
     def __init__(self, name: str):
         self.name = name
 
@@ -95,6 +225,9 @@ class BaseExpert:
 class ContractExpert(BaseExpert):
     """Expert 1: Extracts contract entities, terms, and status."""
 
+    # _CONTRACT_RE can't match without the word "contract".
+    sentinel_keywords = ('contract',)
+
     def __init__(self):
         super().__init__("ContractExpert")
 
@@ -102,48 +235,41 @@ class ContractExpert(BaseExpert):
         result = ExtractionResult(expert_name=self.name)
 
         # Extract contract IDs
-        contract_patterns = re.findall(
-            r'Contract\s*#?\s*(\w+).*?(?:Company|Tenant|Carrier)[:\s]*(\w+[\w\s]*?)(?:\n|,|;)',
-            text, re.IGNORECASE | re.DOTALL
-        )
-
-        # Extract status patterns
-        status_map = {}
-        for match in re.finditer(
-            r'(?:Status|State)[:\s]*(Active|Defaulted|Expired|Pending|Suspended)',
-            text, re.IGNORECASE
-        ):
-            status_map[len(status_map)] = match.group(1).upper()
-
-        # Extract occupancy
-        occupancy_matches = re.findall(
-            r'(\w+).*?(?:occupancy|capacity)[:\s]*(\d+)%',
-            text, re.IGNORECASE
-        )
-
-        # Extract financial terms
-        revenue_matches = re.findall(
-            r'(?:revenue|rent|payment|fee)[:\s]*\$?([\d,]+(?:\.\d{2})?)\s*(?:/mo|per\s*month|monthly)?',
-            text, re.IGNORECASE
-        )
-
-        outstanding_matches = re.findall(
-            r'(?:outstanding|arrears|overdue|owed)[:\s]*\$?([\d,]+(?:\.\d{2})?)',
-            text, re.IGNORECASE
-        )
+        contract_patterns = _CONTRACT_RE.findall(text)
+
+        # Extract status patterns (in document order; position = contract index)
+        statuses = [match.group(1).upper() for match in _STATUS_RE.finditer(text)]
+
+        # Extract occupancy (shared scan from the orchestrator when present)
+        occupancy_matches = context.get("occupancy_matches") if context else None
+        if occupancy_matches is None:
+            occupancy_matches = _OCCUPANCY_RE.findall(text)
+
+        # Extract financial terms — one combined scan, split by kind
+        revenue_matches = []
+        outstanding_matches = []
+        for m in _MONEY_RE.finditer(text):
+            if m.group('rev') is not None:
+                revenue_matches.append(m.group('amt'))
+            else:
+                outstanding_matches.append(m.group('amt'))
 
         # Build entities from patterns
         idx = 0
         for contract_id, company in contract_patterns:
+            # Normalize once; the stripped/lowered forms feed ids, names,
+            # and properties below.
+            contract_id = contract_id.strip()
             company = company.strip()
-            status = status_map.get(idx, "UNKNOWN")
+            company_key = company.lower().replace(' ', '_')
+            status = statuses[idx] if idx < len(statuses) else "UNKNOWN"
 
             contract_entity = Entity(
-                id=f"contract_{contract_id.strip()}",
+                id=f"contract_{contract_id}",
                 type=EntityType.CONTRACT,
-                name=f"Contract #{contract_id.strip()}",
+                name=f"Contract #{contract_id}",
                 properties={
-                    "contract_id": contract_id.strip(),
+                    "contract_id": contract_id,
                     "company": company,
                     "status": status,
                 },
@@ -161,7 +287,7 @@ class ContractExpert(BaseExpert):
 
             # Create company entity
             company_entity = Entity(
-                id=f"company_{company.lower().replace(' ', '_')}",
+                id=f"company_{company_key}",
                 type=EntityType.COMPANY,
                 name=company,
                 properties={"name": company},
@@ -181,10 +307,15 @@ class ContractExpert(BaseExpert):
 
             idx += 1
 
-        # Add occupancy to company properties
+        # Add occupancy to company properties. Lowered names are computed
+        # once up front; the old loop re-lowered every entity (and type-
+        # checked non-companies) for every occupancy match.
+        companies = [(e.name.lower(), e) for e in result.entities
+                     if e.type == EntityType.COMPANY]
         for company_name, pct in occupancy_matches:
-            for e in result.entities:
-                if e.type == EntityType.COMPANY and company_name.lower() in e.name.lower():
+            needle = company_name.lower()
+            for name_lower, e in companies:
+                if needle in name_lower:
                     e.properties["occupancy_pct"] = int(pct)
 
         result.reasoning = (
@@ -197,6 +328,10 @@ class ContractExpert(BaseExpert):
 class EquipmentExpert(BaseExpert):
     """Expert 2: Extracts equipment entities from contracts + drone data."""
 
+    # Entities are anchored on _EQUIPMENT_RE; the other patterns only
+    # annotate them, so these three words gate all output.
+    sentinel_keywords = ('equipment', 'hardware', 'device')
+
     def __init__(self):
         super().__init__("EquipmentExpert")
 
@@ -204,28 +339,16 @@ class EquipmentExpert(BaseExpert):
         result = ExtractionResult(expert_name=self.name)
 
         # Equipment patterns
-        equipment_patterns = re.findall(
-            r'(?:Equipment|Hardware|Device)[:\s]*([\w\s]+?)(?:\n|,|;|\.)',
-            text, re.IGNORECASE
-        )
+        equipment_patterns = _EQUIPMENT_RE.findall(text)
 
         # Antenna/radio patterns
-        antenna_matches = re.findall(
-            r'(\d+)\s*(?:x\s*)?(?:antennas?|radios?|panels?|dishes?)',
-            text, re.IGNORECASE
-        )
+        antenna_matches = _ANTENNA_RE.findall(text)
 
         # Equipment status
-        equip_status = re.findall(
-            r'(?:equipment|hardware).*?(?:status|condition)[:\s]*(operational|inactive|damaged|rusted|degraded)',
-            text, re.IGNORECASE
-        )
+        equip_status = _EQUIP_STATUS_RE.findall(text)
 
         # Drone observation patterns
-        drone_obs = re.findall(
-            r'(?:drone|inspection|visual|image).*?(?:detected|found|shows?|observed)[:\s]*(.*?)(?:\n|\.)',
-            text, re.IGNORECASE
-        )
+        drone_obs = _DRONE_RE.findall(text)
 
         # Build equipment entities
         for i, (equip_name,) in enumerate([(e,) for e in equipment_patterns]):
@@ -263,6 +386,10 @@ class EquipmentExpert(BaseExpert):
 class FinancialRiskExpert(BaseExpert):
     """Expert 3: Detects financial risks, payment defaults, revenue exposure."""
 
+    # Required alternations of _DEFAULT_RE and _REVENUE_RISK_RE.
+    sentinel_keywords = ('default', 'arrears', 'overdue', 'delinquent',
+                         'annual', 'yearly', 'monthly')
+
     def __init__(self):
         super().__init__("FinancialRiskExpert")
 
@@ -270,24 +397,13 @@ class FinancialRiskExpert(BaseExpert):
         result = ExtractionResult(expert_name=self.name)
 
         # Default/arrears detection
-        default_patterns = re.findall(
-            r'(?:default(?:ed)?|arrears|overdue|delinquent).*?'
-            r'(?:(\d+)\s*days?)?.*?'
-            r'(?:\$?([\d,]+(?:\.\d{2})?))?',
-            text, re.IGNORECASE
-        )
+        default_patterns = _DEFAULT_RE.findall(text)
 
         # Revenue at risk
-        revenue_risk = re.findall(
-            r'(?:annual|yearly|monthly)\s*(?:revenue|value|rent)[:\s]*\$?([\d,]+(?:\.\d{2})?)',
-            text, re.IGNORECASE
-        )
+        revenue_risk = _REVENUE_RISK_RE.findall(text)
 
         # Payment history signals
-        payment_issues = re.findall(
-            r'(?:missed|late|partial)\s*(?:payment|installment)',
-            text, re.IGNORECASE
-        )
+        payment_issues = _PAYMENT_ISSUES_RE.findall(text)
 
         for i, (days, amount) in enumerate(default_patterns):
             severity = Severity.HIGH if int(days or 0) > 60 else Severity.MEDIUM
@@ -337,6 +453,12 @@ class FinancialRiskExpert(BaseExpert):
 class OpportunityExpert(BaseExpert):
     """Expert 4: Reasoning layer - identifies upsell, cross-sell, maintenance opportunities."""
 
+    # Upsell needs occupancy/capacity, cross-sell the defaulted-equipment
+    # words, maintenance the _MAINT_RE condition words.
+    sentinel_keywords = ('occupancy', 'capacity', 'defaulted', 'inactive',
+                         'abandoned', 'rust', 'corrosion', 'damaged',
+                         'cracked', 'loose', 'degraded')
+
     def __init__(self):
         super().__init__("OpportunityExpert")
 
@@ -344,26 +466,35 @@ class OpportunityExpert(BaseExpert):
         result = ExtractionResult(expert_name=self.name)
         context = context or {}
 
-        # Upsell: Look for capacity/occupancy gaps
-        occupancy_matches = re.findall(
-            r'(\w+).*?(?:occupancy|capacity)[:\s]*(\d+)%',
-            text, re.IGNORECASE
-        )
+        # Upsell: Look for capacity/occupancy gaps (shared scan when present)
+        occupancy_matches = context.get("occupancy_matches")
+        if occupancy_matches is None:
+            occupancy_matches = _OCCUPANCY_RE.findall(text)
+
+        # Collect monthly-revenue mentions in one pass — the old code
+        # compiled a fresh per-company pattern and re-scanned the full
+        # text for every occupancy match. Each mention keeps its line
+        # prefix so the company-precedes-amount-on-the-same-line
+        # semantics of the original search are preserved.
+        rev_mentions = []
+        if occupancy_matches:
+            for m in _MONTHLY_REV_RE.finditer(text):
+                line_start = text.rfind('\n', 0, m.start()) + 1
+                rev_mentions.append((text[line_start:m.start()].lower(), m.group(1)))
 
         for company, pct in occupancy_matches:
             pct_int = int(pct)
             if pct_int < 100:
                 gap = 100 - pct_int
                 # Estimate revenue uplift
-                monthly_rev_match = re.search(
-                    rf'{company}.*?\$?([\d,]+)(?:/mo|per\s*month)',
-                    text, re.IGNORECASE
-                )
-                current_rev = float(monthly_rev_match.group(1).replace(',', '')) if monthly_rev_match else 0
+                company_lower = company.lower()
+                amount = next((a for prefix, a in rev_mentions
+                               if company_lower in prefix), None)
+                current_rev = float(amount.replace(',', '')) if amount else 0
                 potential_uplift = (current_rev / pct_int * gap) if pct_int > 0 and current_rev > 0 else 0
 
                 opp = Entity(
-                    id=f"opportunity_upsell_{company.lower()}",
+                    id=f"opportunity_upsell_{company_lower}",
                     type=EntityType.OPPORTUNITY,
                     name=f"Upsell: {company} Capacity Expansion",
                     properties={
@@ -380,10 +511,7 @@ class OpportunityExpert(BaseExpert):
                 result.entities.append(opp)
 
         # Equipment removal: Defaulted equipment
-        defaulted = re.findall(
-            r'(?:defaulted|inactive|abandoned).*?(?:equipment|hardware|dish|antenna)(.*?)(?:\n|\.)',
-            text, re.IGNORECASE
-        )
+        defaulted = _DEFAULTED_EQUIP_RE.findall(text)
 
         for i, details in enumerate(defaulted):
             opp = Entity(
@@ -402,10 +530,7 @@ class OpportunityExpert(BaseExpert):
             result.entities.append(opp)
 
         # Maintenance: Structural/safety issues
-        maintenance_signals = re.findall(
-            r'(?:rust(?:ed)?|corrosion|damaged|cracked|loose|degraded)(.*?)(?:\n|\.)',
-            text, re.IGNORECASE
-        )
+        maintenance_signals = _MAINT_RE.findall(text)
 
         for i, details in enumerate(maintenance_signals):
             opp = Entity(
@@ -437,43 +562,191 @@ class MoEOrchestrator:
     Routes text through specialized experts and merges results.
     """
 
-    def __init__(self):
+    #: Default expert line-up when no explicit selection is given
+    DEFAULT_EXPERTS = (
+        "ContractExpert",
+        "EquipmentExpert",
+        "FinancialRiskExpert",
+        "OpportunityExpert",
+    )
+
+    def __init__(self, expert_names: Optional[List[str]] = None):
+        # Instantiate only the requested experts — disabled experts cost
+        # nothing, neither construction nor a scan over the document.
+        registry = {
+            "ContractExpert": ContractExpert,
+            "EquipmentExpert": EquipmentExpert,
+            "FinancialRiskExpert": FinancialRiskExpert,
+            "OpportunityExpert": OpportunityExpert,
+            "HealthcareExpert": HealthcareExpert,
+        }
+        if expert_names is None:
+            expert_names = list(self.DEFAULT_EXPERTS)
         self.experts: List[BaseExpert] = [
-            ContractExpert(),
-            EquipmentExpert(),
-            FinancialRiskExpert(),
-            OpportunityExpert(),
+            registry[name]() for name in expert_names if name in registry
         ]
 
     def extract_all(self, text: str, context: Dict = None) -> Dict[str, ExtractionResult]:
-        """Run all experts and return merged extraction results."""
+        """Run all experts (in parallel) and return merged extraction results."""
         results = {}
         all_entities = []
-
+        context = dict(context) if context else {}
+
+        # Contract and Opportunity experts run the identical occupancy
+        # pattern; scan once here and hand the matches to both so the
+        # document isn't walked twice for the same answer.
+        if any(e.name in ("ContractExpert", "OpportunityExpert") for e in self.experts):
+            context.setdefault("occupancy_matches", _OCCUPANCY_RE.findall(text))
+
+        # Literal prefilter: an expert whose sentinel keywords never appear
+        # cannot match anything, so a handful of C-level substring probes
+        # replaces its dozen regex passes over the document.
+        text_lower = text.lower()
+        active = []
         for expert in self.experts:
-            try:
-                extraction = expert.extract(text, context)
-                results[expert.name] = extraction
-                all_entities.extend(extraction.entities)
-                print(f"  [✓] {expert.name}: {len(extraction.entities)} entities, "
-                      f"{len(extraction.relationships)} relationships")
-                print(f"      Reasoning: {extraction.reasoning}")
-            except Exception as e:
-                print(f"  [✗] {expert.name}: Error - {e}")
-                results[expert.name] = ExtractionResult(expert_name=expert.name)
-
-        # Pass all entities as context to opportunity expert for cross-referencing
+            kws = expert.sentinel_keywords
+            if kws and not any(kw in text_lower for kw in kws):
+                results[expert.name] = ExtractionResult(
+                    expert_name=expert.name,
+                    reasoning="Skipped: no sentinel keywords in document.",
+                )
+                print(f"  [–] {expert.name}: skipped (no sentinel keywords)")
+            else:
+                active.append(expert)
+
+        # Experts are read-only during extract(), so run them on a thread
+        # pool. Note stdlib `re` holds the GIL during matching, so the
+        # pool mostly overlaps scheduling and any I/O; real parallel
+        # scanning only happens when the optional re2 engine is in use.
+        with extraction_timestamp() as ts, ThreadPoolExecutor(max_workers=max(1, len(active))) as pool:
+            futures = {
+                expert.name: pool.submit(run_with_extraction_ts, ts,
+                                         expert.extract, text, context)
+                for expert in active
+            }
+
+            for expert in active:
+                try:
+                    extraction = futures[expert.name].result()
+                    results[expert.name] = extraction
+                    all_entities.extend(extraction.entities)
+                    print(f"  [✓] {expert.name}: {len(extraction.entities)} entities, "
+                          f"{len(extraction.relationships)} relationships")
+                    print(f"      Reasoning: {extraction.reasoning}")
+                except Exception as e:
+                    print(f"  [✗] {expert.name}: Error - {e}")
+                    results[expert.name] = ExtractionResult(expert_name=expert.name)
+
+        # Pass all entities as context for cross-referencing. Raw Entity
+        # objects — the old per-entity asdict() deep-copied every
+        # properties dict for a consumer that can read attributes directly.
         if all_entities:
-            context = context or {}
-            context["all_entities"] = [asdict(e) for e in all_entities]
+            context["all_entities"] = all_entities
 
         return results
 
+    def extract_all_batch(self, texts: List[str], context: Dict = None) -> List[Dict[str, ExtractionResult]]:
+        """
+        Extract from several documents in one go, fanning every
+        (document, expert) pair onto a single thread pool so the scans
+        overlap instead of running K documents serially.
+        """
+        batch: List[Dict[str, ExtractionResult]] = [{} for _ in texts]
+        if not texts:
+            return batch
+
+        max_workers = min(len(texts) * len(self.experts), 16)
+        with extraction_timestamp() as ts, ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                (i, expert.name): pool.submit(run_with_extraction_ts, ts,
+                                              expert.extract, text, context)
+                for i, text in enumerate(texts)
+                for expert in self.experts
+            }
+            for (i, name), future in futures.items():
+                try:
+                    batch[i][name] = future.result()
+                except Exception as e:
+                    print(f"  [✗] doc {i} {name}: Error - {e}")
+                    batch[i][name] = ExtractionResult(expert_name=name)
+        return batch
+
 
 # ============================================================
 # SECTION 3: CONTEXT GRAPH BUILDER (Neo4j Cypher Generation)
 # ============================================================
 
+# Cypher property formatting: one C-level translate pass for escaping and
+# an exact-type dispatch table instead of an isinstance chain per value.
+# (type(True) is bool, so bools never fall through to the int formatter.)
+_CYPHER_ESCAPE = str.maketrans({"'": "\\'", "\\": "\\\\"})
+
+_CYPHER_FORMATTERS = {
+    str: lambda v: f"'{v.translate(_CYPHER_ESCAPE)}'",
+    bool: lambda v: 'true' if v else 'false',
+    int: str,
+    float: str,
+}
+
+# Anything else (StrEnum members, dates, ...) renders as a quoted string,
+# matching the old else-branch.
+_CYPHER_DEFAULT_FORMAT = "'{}'".format
+
+
+# The agent query library has zero dynamic content — materialize it once
+# at import instead of re-appending ~40 lines per call.
+_QUERY_LIBRARY = """\
+// ============================================
+// ECL Agent Query Library
+// ============================================
+
+// Q1: Find all opportunities for a tower
+MATCH (t:Tower)-[:HAS_OPPORTUNITY]->(o:Opportunity)
+RETURN t.name AS tower, o.name AS opportunity,
+       o.opportunity_type AS type, o.potential_monthly_uplift AS uplift
+ORDER BY o.potential_monthly_uplift DESC;
+
+// Q2: Identify equipment needing removal
+MATCH (e:Equipment {status: 'inactive'})-[:INSTALLED_ON]->(t:Tower)
+MATCH (c:Company)-[:HAS_EQUIPMENT]->(e)
+RETURN t.name AS tower, c.name AS company, e.name AS equipment;
+
+// Q3: Get complete tower context (for AI agent)
+MATCH (t:Tower {id: $tower_id})
+OPTIONAL MATCH (t)<-[:OCCUPIES]-(c:Contract)
+OPTIONAL MATCH (t)<-[:HAS_EQUIPMENT]-(co:Company)
+OPTIONAL MATCH (t)-[:HAS_OPPORTUNITY]->(o:Opportunity)
+OPTIONAL MATCH (t)-[:HAS_RISK]->(r:Risk)
+RETURN t, collect(DISTINCT c) AS contracts,
+       collect(DISTINCT co) AS companies,
+       collect(DISTINCT o) AS opportunities,
+       collect(DISTINCT r) AS risks;
+
+// Q4: Calculate total revenue at risk
+MATCH (r:Risk)-[:AFFECTS]->(c:Contract)
+RETURN sum(toFloat(c.outstanding_amount)) AS total_arrears,
+       sum(toFloat(c.monthly_revenue) * 12) AS annual_at_risk;
+
+// Q5: Cross-company relationship discovery
+MATCH path = (c1:Company)-[*1..3]-(c2:Company)
+WHERE c1 <> c2
+RETURN c1.name, c2.name, [r IN relationships(path) | type(r)] AS via;
+"""
+
+
+class _StreamLines:
+    """List-like append() adapter that writes each line straight to a sink,
+    so Cypher emitters can stream to disk without buffering the script."""
+    __slots__ = ("_write",)
+
+    def __init__(self, out):
+        self._write = out.write
+
+    def append(self, line: str):
+        self._write(line)
+        self._write("\n")
+
+
 class ContextGraphBuilder:
     """Builds Neo4j Cypher statements from extracted entities and relationships."""
 
@@ -481,24 +754,66 @@ class ContextGraphBuilder:
         self.cypher_statements: List[str] = []
         self.nodes: Dict[str, Entity] = {}
         self.edges: List[Relationship] = []
+        # Canonical (type, lowercased name) -> node id, so the same entity
+        # found by different experts under different ids merges here rather
+        # than leaking duplicates to every downstream consumer.
+        self._canonical_ids: Dict[tuple, str] = {}
+        # Type-indexed view of the nodes, so consumers that want "all
+        # contracts" iterate a keyed list instead of branching over the
+        # whole node dict.
+        self.nodes_by_type: Dict[EntityType, List[Entity]] = defaultdict(list)
+        # (node count, edge count) stamp -> serialized Cypher, so
+        # re-exporting an unchanged graph returns the cached script.
+        self._cypher_cache: Optional[tuple] = None
+
+    def add_node(self, entity: Entity):
+        """Insert a node directly (e.g. a manually-built root entity)."""
+        self.nodes[entity.id] = entity
+        self._canonical_ids[(entity.type, entity.name.strip().lower())] = entity.id
+        self.nodes_by_type[entity.type].append(entity)
 
     def add_extraction_results(self, results: Dict[str, ExtractionResult]):
         """Merge all expert results into a unified graph."""
         for expert_name, extraction in results.items():
             for entity in extraction.entities:
-                # Deduplicate by ID
-                if entity.id not in self.nodes:
+                # Deduplicate by ID, then by canonical (type, name)
+                existing_id = entity.id if entity.id in self.nodes else None
+                canonical = (entity.type, entity.name.strip().lower())
+                if existing_id is None:
+                    existing_id = self._canonical_ids.get(canonical)
+
+                if existing_id is None:
                     self.nodes[entity.id] = entity
+                    self._canonical_ids[canonical] = entity.id
+                    self.nodes_by_type[entity.type].append(entity)
                 else:
                     # Merge properties
-                    self.nodes[entity.id].properties.update(entity.properties)
+                    self.nodes[existing_id].properties.update(entity.properties)
 
             for rel in extraction.relationships:
                 self.edges.append(rel)
 
-    def generate_cypher(self) -> str:
-        """Generate complete Neo4j Cypher CREATE statements."""
-        lines = []
+    def generate_cypher(self, out=None) -> Optional[str]:
+        """Generate complete Neo4j Cypher CREATE statements.
+
+        Streams lines straight to the file-like `out` when given, so large
+        graphs never hold the whole script in memory twice; returns the
+        script as a string when `out` is None.
+        """
+        if out is None:
+            # Generation-aware cache: same stamp as the MCP indexes. In-
+            # place property edits don't move the stamp, but nothing in
+            # this tree mutates properties between exports.
+            stamp = (len(self.nodes), len(self.edges))
+            if self._cypher_cache is not None and self._cypher_cache[0] == stamp:
+                return self._cypher_cache[1]
+            buf = io.StringIO()
+            self.generate_cypher(out=buf)
+            script = buf.getvalue()
+            self._cypher_cache = (stamp, script)
+            return script
+
+        lines = _StreamLines(out)
         lines.append("// ============================================")
         lines.append("// ECL Context Graph - Auto-Generated Cypher")
         lines.append(f"// Generated: {datetime.now().isoformat()}")
@@ -510,113 +825,86 @@ class ContextGraphBuilder:
         lines.append("// MATCH (n) DETACH DELETE n;")
         lines.append("")
 
+        # One pass over the node dict both groups nodes per label and
+        # yields the label set for the index statements — no separate
+        # set-comprehension traversal.
+        nodes_by_label: Dict[str, List[Entity]] = {}
+        for entity in self.nodes.values():
+            nodes_by_label.setdefault(entity.type.value, []).append(entity)
+
         # Create constraint indexes
         lines.append("// Indexes for performance")
-        unique_types = set(e.type.value for e in self.nodes.values())
-        for t in sorted(unique_types):
+        for t in sorted(nodes_by_label):
             lines.append(f"CREATE INDEX IF NOT EXISTS FOR (n:{t}) ON (n.id);")
         lines.append("")
 
-        # Create nodes
-        lines.append("// === CREATE NODES ===")
-        for entity_id, entity in self.nodes.items():
-            props = {
-                "id": entity.id,
-                "name": entity.name,
-                "confidence": entity.confidence,
-                "source_expert": entity.source_expert,
-                **entity.properties
-            }
-            props_str = self._format_properties(props)
-            var_name = self._safe_var_name(entity.id)
-            lines.append(f"CREATE ({var_name}:{entity.type.value} {props_str})")
+        # Nodes are emitted as one parameterized UNWIND batch per label,
+        # so Neo4j parses and plans one statement per label instead of
+        # re-planning a standalone CREATE per row.
+        lines.append("// === CREATE NODES (one UNWIND batch per label) ===")
+        for label in sorted(nodes_by_label):
+            rows = ", ".join(
+                self._format_properties({
+                    "id": entity.id,
+                    "name": entity.name,
+                    "confidence": entity.confidence,
+                    "source_expert": entity.source_expert,
+                    **entity.properties
+                })
+                for entity in nodes_by_label[label]
+            )
+            lines.append(f":param rows_{label} => [{rows}];")
+            lines.append(f"UNWIND $rows_{label} AS r CREATE (n:{label}) SET n = r;")
+            lines.append("")
 
-        lines.append("")
-        lines.append("// === CREATE RELATIONSHIPS ===")
+        # Same batching for relationships, matched by node id.
+        lines.append("// === CREATE RELATIONSHIPS (one UNWIND batch per type) ===")
+        rels_by_type: Dict[str, List[Relationship]] = {}
         for rel in self.edges:
-            src_var = self._safe_var_name(rel.source_id)
-            tgt_var = self._safe_var_name(rel.target_id)
-            props_str = self._format_properties(rel.properties) if rel.properties else ""
-            if props_str:
-                lines.append(f"CREATE ({src_var})-[:{rel.type.value} {props_str}]->({tgt_var})")
-            else:
-                lines.append(f"CREATE ({src_var})-[:{rel.type.value}]->({tgt_var})")
+            rels_by_type.setdefault(rel.type.value, []).append(rel)
+
+        for rtype in sorted(rels_by_type):
+            # Ids go through the same quote escaping as property values —
+            # canonical ids keep apostrophes from names like O'Brien.
+            rows = ", ".join(
+                "{{src: '{}', tgt: '{}', props: {}}}".format(
+                    rel.source_id.translate(_CYPHER_ESCAPE),
+                    rel.target_id.translate(_CYPHER_ESCAPE),
+                    self._format_properties(rel.properties) if rel.properties else "{}")
+                for rel in rels_by_type[rtype]
+            )
+            lines.append(f":param rels_{rtype} => [{rows}];")
+            lines.append(f"UNWIND $rels_{rtype} AS r "
+                         f"MATCH (s {{id: r.src}}), (t {{id: r.tgt}}) "
+                         f"CREATE (s)-[e:{rtype}]->(t) SET e = r.props;")
+            lines.append("")
+        return None
 
-        lines.append("")
-        lines.append(";")
-
-        return "\n".join(lines)
-
-    def generate_query_library(self) -> str:
-        """Generate useful Cypher queries for AI agents."""
-        queries = []
-        queries.append("// ============================================")
-        queries.append("// ECL Agent Query Library")
-        queries.append("// ============================================")
-        queries.append("")
-
-        queries.append("// Q1: Find all opportunities for a tower")
-        queries.append("MATCH (t:Tower)-[:HAS_OPPORTUNITY]->(o:Opportunity)")
-        queries.append("RETURN t.name AS tower, o.name AS opportunity,")
-        queries.append("       o.opportunity_type AS type, o.potential_monthly_uplift AS uplift")
-        queries.append("ORDER BY o.potential_monthly_uplift DESC;")
-        queries.append("")
-
-        queries.append("// Q2: Identify equipment needing removal")
-        queries.append("MATCH (e:Equipment {status: 'inactive'})-[:INSTALLED_ON]->(t:Tower)")
-        queries.append("MATCH (c:Company)-[:HAS_EQUIPMENT]->(e)")
-        queries.append("RETURN t.name AS tower, c.name AS company, e.name AS equipment;")
-        queries.append("")
-
-        queries.append("// Q3: Get complete tower context (for AI agent)")
-        queries.append("MATCH (t:Tower {id: $tower_id})")
-        queries.append("OPTIONAL MATCH (t)<-[:OCCUPIES]-(c:Contract)")
-        queries.append("OPTIONAL MATCH (t)<-[:HAS_EQUIPMENT]-(co:Company)")
-        queries.append("OPTIONAL MATCH (t)-[:HAS_OPPORTUNITY]->(o:Opportunity)")
-        queries.append("OPTIONAL MATCH (t)-[:HAS_RISK]->(r:Risk)")
-        queries.append("RETURN t, collect(DISTINCT c) AS contracts,")
-        queries.append("       collect(DISTINCT co) AS companies,")
-        queries.append("       collect(DISTINCT o) AS opportunities,")
-        queries.append("       collect(DISTINCT r) AS risks;")
-        queries.append("")
-
-        queries.append("// Q4: Calculate total revenue at risk")
-        queries.append("MATCH (r:Risk)-[:AFFECTS]->(c:Contract)")
-        queries.append("RETURN sum(toFloat(c.outstanding_amount)) AS total_arrears,")
-        queries.append("       sum(toFloat(c.monthly_revenue) * 12) AS annual_at_risk;")
-        queries.append("")
-
-        queries.append("// Q5: Cross-company relationship discovery")
-        queries.append("MATCH path = (c1:Company)-[*1..3]-(c2:Company)")
-        queries.append("WHERE c1 <> c2")
-        queries.append("RETURN c1.name, c2.name, [r IN relationships(path) | type(r)] AS via;")
-
-        return "\n".join(queries)
+    def generate_query_library(self, out=None) -> Optional[str]:
+        """Return (or stream) the static Cypher query library for AI agents."""
+        if out is None:
+            return _QUERY_LIBRARY
+        out.write(_QUERY_LIBRARY)
+        return None
 
     @staticmethod
     def _format_properties(props: Dict) -> str:
-        formatted = []
-        for k, v in props.items():
-            if isinstance(v, str):
-                escaped = v.replace("'", "\\'")
-                formatted.append(f"{k}: '{escaped}'")
-            elif isinstance(v, bool):
-                formatted.append(f"{k}: {'true' if v else 'false'}")
-            elif isinstance(v, (int, float)):
-                formatted.append(f"{k}: {v}")
-            else:
-                formatted.append(f"{k}: '{v}'")
-        return "{" + ", ".join(formatted) + "}"
-
-    @staticmethod
-    def _safe_var_name(entity_id: str) -> str:
-        return re.sub(r'[^a-zA-Z0-9]', '_', entity_id)
+        fmts = _CYPHER_FORMATTERS
+        return "{" + ", ".join(
+            f"{k}: {fmts.get(type(v), _CYPHER_DEFAULT_FORMAT)(v)}"
+            for k, v in props.items()
+        ) + "}"
 
 
 # ============================================================
 # SECTION 4: MCP (Model Context Protocol) AGENT INTERFACE
 # ============================================================
 
+# Case-insensitive tool-argument -> EntityType lookup (tools accept
+# "tower" as well as "Tower").
+_ENTITY_TYPE_BY_LOWER = {t.value.lower(): t for t in EntityType}
+
+
 class MCPToolServer:
     """
     Simulated MCP Server exposing ECL graph tools for AI agents.
@@ -632,10 +920,46 @@ class MCPToolServer:
             "get_company_relationships": self.get_company_relationships,
             "search_entities": self.search_entities,
         }
+        # Per-node adjacency lists so context lookups walk deg(v) edges
+        # instead of scanning the whole edge list per call. Built lazily
+        # and re-stamped by (node, edge) counts — demos append to
+        # graph.edges directly, so counts are the mutation signal.
+        self._adj: Dict[str, List[Relationship]] = {}
+        # Lowercased searchable text per node, so keyword search is one
+        # substring probe instead of asdict + json.dumps + lower per node.
+        self._search_blob: Dict[str, str] = {}
+        # Memoized responses for the deterministic queries, keyed by
+        # (tool, args) and flushed whenever the indexes rebuild. Agents
+        # tend to repeat the same handful of queries between mutations.
+        self._query_cache: Dict[tuple, Dict] = {}
+        self._index_stamp = (-1, -1)
+
+    def _ensure_indexes(self):
+        """(Re)build lookup indexes if the graph has grown since last call."""
+        stamp = (len(self.graph.nodes), len(self.graph.edges))
+        if stamp == self._index_stamp:
+            return
+        adj: Dict[str, List[Relationship]] = defaultdict(list)
+        for rel in self.graph.edges:
+            adj[rel.source_id].append(rel)
+            if rel.target_id != rel.source_id:
+                adj[rel.target_id].append(rel)
+        self._adj = adj
+        self._query_cache.clear()
+        self._search_blob = {
+            entity.id: " ".join((
+                entity.id, entity.type.value, entity.name,
+                entity.source_expert,
+                " ".join(f"{k}={v}" for k, v in entity.properties.items()),
+            )).lower()
+            for entity in self.graph.nodes.values()
+        }
+        self._index_stamp = stamp
 
-    def list_tools(self) -> List[Dict]:
-        """MCP tools/list - Returns available tools for AI agents."""
-        return [
+    # The tool schema is static — build it once at class level instead of
+    # allocating the same nested dicts on every tools/list poll. Callers
+    # must treat the returned list as read-only.
+    _TOOLS_LIST = [
             {
                 "name": "get_tower_context",
                 "description": "Get complete context for a tower including contracts, equipment, opportunities, and risks",
@@ -693,43 +1017,67 @@ class MCPToolServer:
             },
         ]
 
+    def list_tools(self) -> List[Dict]:
+        """MCP tools/list - Returns available tools for AI agents."""
+        return self._TOOLS_LIST
+
     def call_tool(self, tool_name: str, arguments: Dict) -> Dict:
         """MCP tools/call - Execute a tool and return results."""
-        if tool_name not in self.tools:
+        fn = self.tools.get(tool_name)
+        if fn is None:
             return {"error": f"Unknown tool: {tool_name}"}
-        return self.tools[tool_name](**arguments)
+        return fn(**arguments)
+
+    def call_tools_batch(self, calls: List[tuple]) -> List[Dict]:
+        """Execute several independent tool calls concurrently.
+
+        Takes (tool_name, arguments) pairs and returns results in the
+        same order. Tools only read the graph (index rebuilds are
+        idempotent), so overlapping them on a thread pool is safe and
+        hides the per-call serialization latency when an agent fans out
+        multiple queries at once.
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(calls), 8)) as pool:
+            futures = [pool.submit(self.call_tool, name, args)
+                       for name, args in calls]
+            return [f.result() for f in futures]
 
     def get_tower_context(self, tower_id: str) -> Dict:
         """Returns full context graph for a specific tower."""
-        tower_entities = []
-        tower_relationships = []
-
-        # Find tower node
+        # Find tower node (type-indexed — only tower nodes are probed)
+        towers = self.graph.nodes_by_type.get(EntityType.TOWER, [])
         tower_node = None
-        for eid, entity in self.graph.nodes.items():
-            if entity.type == EntityType.TOWER and tower_id.lower() in eid.lower():
+        for entity in towers:
+            if tower_id.lower() in entity.id.lower():
                 tower_node = entity
                 break
 
         if not tower_node:
-            return {"error": f"Tower {tower_id} not found", "available_towers": [
-                e.name for e in self.graph.nodes.values() if e.type == EntityType.TOWER
-            ]}
-
-        # Gather all connected entities
-        connected_ids = set()
-        for rel in self.graph.edges:
-            if tower_node.id in (rel.source_id, rel.target_id):
-                connected_ids.add(rel.source_id)
-                connected_ids.add(rel.target_id)
-                tower_relationships.append(asdict(rel))
+            return {"error": f"Tower {tower_id} not found",
+                    "available_towers": [e.name for e in towers]}
+
+        # One O(deg) pass over the incident edges: serialize them and
+        # collect the far endpoint of each. The tower itself is returned
+        # under "tower", not duplicated among the connected entities.
+        self._ensure_indexes()
+        tid = tower_node.id
+        incident = self._adj.get(tid, ())
+        tower_relationships = [rel.to_dict() for rel in incident]
+        connected_ids = {
+            rel.target_id if rel.source_id == tid else rel.source_id
+            for rel in incident
+        }
 
-        for eid in connected_ids:
-            if eid in self.graph.nodes:
-                tower_entities.append(asdict(self.graph.nodes[eid]))
+        # Membership guard stays: canonical-name dedup in the builder can
+        # leave edges referencing a merged-away entity id.
+        nodes = self.graph.nodes
+        tower_entities = [nodes[eid].to_dict() for eid in connected_ids
+                          if eid in nodes]
 
         return {
-            "tower": asdict(tower_node),
+            "tower": tower_node.to_dict(),
             "connected_entities": tower_entities,
             "relationships": tower_relationships,
             "entity_count": len(tower_entities),
@@ -738,66 +1086,82 @@ class MCPToolServer:
 
     def find_opportunities(self, opportunity_type: str = "ALL") -> Dict:
         """Returns opportunities filtered by type."""
-        opportunities = []
-        for entity in self.graph.nodes.values():
-            if entity.type == EntityType.OPPORTUNITY:
-                if opportunity_type == "ALL" or entity.properties.get("opportunity_type") == opportunity_type:
-                    opportunities.append(asdict(entity))
+        self._ensure_indexes()
+        key = ("find_opportunities", opportunity_type)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        opportunities = [
+            entity.to_dict()
+            for entity in self.graph.nodes_by_type.get(EntityType.OPPORTUNITY, [])
+            if opportunity_type == "ALL"
+            or entity.properties.get("opportunity_type") == opportunity_type
+        ]
 
-        return {
+        response = {
             "opportunities": opportunities,
             "count": len(opportunities),
             "filter": opportunity_type,
         }
+        self._query_cache[key] = response
+        return response
 
     def assess_risk(self, entity_id: str = "") -> Dict:
         """Returns risk assessment for an entity."""
-        risks = []
-        for entity in self.graph.nodes.values():
-            if entity.type == EntityType.RISK:
-                risks.append(asdict(entity))
+        self._ensure_indexes()
+        key = ("assess_risk", entity_id)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
 
-        financials = []
-        for entity in self.graph.nodes.values():
-            if entity.type == EntityType.FINANCIAL:
-                financials.append(asdict(entity))
+        by_type = self.graph.nodes_by_type
+        risks = [e.to_dict() for e in by_type.get(EntityType.RISK, [])]
+        financials = [e.to_dict() for e in by_type.get(EntityType.FINANCIAL, [])]
 
-        return {
+        response = {
             "risks": risks,
             "financial_summary": financials,
             "total_risks": len(risks),
         }
+        self._query_cache[key] = response
+        return response
 
     def get_company_relationships(self, company_name: str) -> Dict:
         """Returns all relationships for a company."""
         company_node = None
-        for entity in self.graph.nodes.values():
-            if entity.type == EntityType.COMPANY and company_name.lower() in entity.name.lower():
+        for entity in self.graph.nodes_by_type.get(EntityType.COMPANY, []):
+            if company_name.lower() in entity.name.lower():
                 company_node = entity
                 break
 
         if not company_node:
             return {"error": f"Company {company_name} not found"}
 
-        rels = []
-        for rel in self.graph.edges:
-            if company_node.id in (rel.source_id, rel.target_id):
-                rels.append(asdict(rel))
+        self._ensure_indexes()
+        rels = [rel.to_dict() for rel in self._adj.get(company_node.id, ())]
 
         return {
-            "company": asdict(company_node),
+            "company": company_node.to_dict(),
             "relationships": rels,
             "relationship_count": len(rels),
         }
 
     def search_entities(self, entity_type: str = "", keyword: str = "") -> Dict:
         """Search entities by type or keyword."""
-        results = []
-        for entity in self.graph.nodes.values():
-            type_match = not entity_type or entity.type.value.lower() == entity_type.lower()
-            keyword_match = not keyword or keyword.lower() in json.dumps(asdict(entity)).lower()
-            if type_match and keyword_match:
-                results.append(asdict(entity))
+        if entity_type:
+            etype = _ENTITY_TYPE_BY_LOWER.get(entity_type.lower())
+            candidates = self.graph.nodes_by_type.get(etype, []) if etype else []
+        else:
+            candidates = self.graph.nodes.values()
+
+        kw = keyword.lower()
+        if kw:
+            self._ensure_indexes()
+            blobs = self._search_blob
+            results = [e.to_dict() for e in candidates if kw in blobs[e.id]]
+        else:
+            results = [e.to_dict() for e in candidates]
 
         return {"results": results, "count": len(results)}
 
@@ -806,6 +1170,19 @@ class MCPToolServer:
 # SECTION 5: NETWORKX VISUALIZATION (Neo4j-Free Demo)
 # ============================================================
 
+# One shared palette for both visualization back-ends; types without an
+# entry fall back to "#CCCCCC" at the lookup site.
+_ENTITY_COLOR_MAP: Dict[EntityType, str] = {
+    EntityType.TOWER: "#FF6B6B",
+    EntityType.COMPANY: "#4ECDC4",
+    EntityType.CONTRACT: "#45B7D1",
+    EntityType.EQUIPMENT: "#96CEB4",
+    EntityType.OPPORTUNITY: "#FFEAA7",
+    EntityType.RISK: "#FF7675",
+    EntityType.FINANCIAL: "#DDA0DD",
+    EntityType.PERSON: "#74B9FF",
+}
+
 def build_networkx_graph(graph_builder: ContextGraphBuilder):
     """Build a NetworkX graph for local visualization (no Neo4j required)."""
     try:
@@ -813,35 +1190,31 @@ def build_networkx_graph(graph_builder: ContextGraphBuilder):
 
         G = nx.DiGraph()
 
-        # Color map by entity type
-        color_map = {
-            EntityType.TOWER: "#FF6B6B",
-            EntityType.COMPANY: "#4ECDC4",
-            EntityType.CONTRACT: "#45B7D1",
-            EntityType.EQUIPMENT: "#96CEB4",
-            EntityType.OPPORTUNITY: "#FFEAA7",
-            EntityType.RISK: "#FF7675",
-            EntityType.FINANCIAL: "#DDA0DD",
-            EntityType.PERSON: "#74B9FF",
-        }
-
         # Reserved keys that shouldn't be unpacked from properties
         reserved_keys = {'type', 'label', 'color', 'id'}
-        
+
+        # Bind the bound methods once — on a big graph the repeated
+        # attribute chains are pure per-iteration overhead.
+        add_node = G.add_node
         for entity_id, entity in graph_builder.nodes.items():
+            etype = entity.type
             # Filter out reserved keys to avoid duplicate keyword arguments
             safe_props = {k: str(v) for k, v in entity.properties.items() if k not in reserved_keys}
-            G.add_node(
+            add_node(
                 entity_id,
                 label=entity.name,
-                type=entity.type.value,
-                color=color_map.get(entity.type, "#CCCCCC"),
+                type=etype.value,
+                color=_ENTITY_COLOR_MAP.get(etype, "#CCCCCC"),
                 **safe_props
             )
 
+        add_edge = G.add_edge
+        # Plain set beats the NodeView for membership: no mapping-view
+        # indirection per probe in the edge loop.
+        graph_nodes = set(G.nodes)
         for rel in graph_builder.edges:
-            if rel.source_id in G.nodes and rel.target_id in G.nodes:
-                G.add_edge(
+            if rel.source_id in graph_nodes and rel.target_id in graph_nodes:
+                add_edge(
                     rel.source_id,
                     rel.target_id,
                     relationship=rel.type.value,
@@ -854,6 +1227,27 @@ def build_networkx_graph(graph_builder: ContextGraphBuilder):
         return None
 
 
+def build_graph_summary(graph_builder: ContextGraphBuilder) -> Dict:
+    """Counts plus ready-to-serialize node/edge lists, without paying for
+    NetworkX's per-node/edge attribute dicts. Use build_networkx_graph
+    only when a real DiGraph is needed for computation."""
+    nodes = [
+        {"id": eid, "label": entity.name, "group": entity.type.value}
+        for eid, entity in graph_builder.nodes.items()
+    ]
+    edges = [
+        {"source": rel.source_id, "target": rel.target_id,
+         "label": rel.type.value}
+        for rel in graph_builder.edges
+    ]
+    return {
+        "node_count": len(nodes),
+        "edge_count": len(edges),
+        "nodes": nodes,
+        "edges": edges,
+    }
+
+
 def export_graph_html(graph_builder: ContextGraphBuilder, output_file: str = "ecl_graph.html"):
     """Export interactive HTML visualization using pyvis (if available) or D3.js."""
     try:
@@ -862,36 +1256,32 @@ def export_graph_html(graph_builder: ContextGraphBuilder, output_file: str = "ec
         net = Network(height="800px", width="100%", bgcolor="#1a1a2e", font_color="white")
         net.barnes_hut(gravity=-3000, central_gravity=0.3, spring_length=200)
 
-        color_map = {
-            EntityType.TOWER: "#FF6B6B",
-            EntityType.COMPANY: "#4ECDC4",
-            EntityType.CONTRACT: "#45B7D1",
-            EntityType.EQUIPMENT: "#96CEB4",
-            EntityType.OPPORTUNITY: "#FFEAA7",
-            EntityType.RISK: "#FF7675",
-            EntityType.FINANCIAL: "#DDA0DD",
-        }
-
+        add_node = net.add_node
         for entity_id, entity in graph_builder.nodes.items():
-            title = f"<b>{entity.name}</b><br>Type: {entity.type.value}<br>"
-            for k, v in entity.properties.items():
-                title += f"{k}: {v}<br>"
+            etype = entity.type
+            is_tower = etype == EntityType.TOWER
+            title = "".join(
+                (f"<b>{entity.name}</b><br>Type: {etype.value}<br>",
+                 *(f"{k}: {v}<br>" for k, v in entity.properties.items()))
+            )
 
-            net.add_node(
+            add_node(
                 entity_id,
                 label=entity.name,
-                color=color_map.get(entity.type, "#CCCCCC"),
+                color=_ENTITY_COLOR_MAP.get(etype, "#CCCCCC"),
                 title=title,
-                size=30 if entity.type == EntityType.TOWER else 20,
-                shape="diamond" if entity.type == EntityType.TOWER else "dot",
+                size=30 if is_tower else 20,
+                shape="diamond" if is_tower else "dot",
             )
 
+        add_edge = net.add_edge
         for rel in graph_builder.edges:
-            net.add_edge(
+            rtype = rel.type.value
+            add_edge(
                 rel.source_id,
                 rel.target_id,
-                title=rel.type.value,
-                label=rel.type.value,
+                title=rtype,
+                label=rtype,
                 color="#888888",
             )
 
@@ -901,28 +1291,31 @@ def export_graph_html(graph_builder: ContextGraphBuilder, output_file: str = "ec
 
     except ImportError:
         # Fallback: Generate raw D3.js HTML
-        nodes_json = []
-        for eid, entity in graph_builder.nodes.items():
-            nodes_json.append({
-                "id": eid, "label": entity.name,
-                "group": entity.type.value
-            })
-
-        edges_json = []
-        for rel in graph_builder.edges:
-            edges_json.append({
-                "source": rel.source_id, "target": rel.target_id,
-                "label": rel.type.value
-            })
+        nodes_json = [
+            {"id": eid, "label": entity.name, "group": entity.type.value}
+            for eid, entity in graph_builder.nodes.items()
+        ]
+        edges_json = [
+            {"source": rel.source_id, "target": rel.target_id,
+             "label": rel.type.value}
+            for rel in graph_builder.edges
+        ]
 
-        html = f"""<!DOCTYPE html>
+        # Stream the document: json.dump serializes straight into the file
+        # between the static HTML parts, so the node/edge JSON never
+        # exists as intermediate strings alongside the final page.
+        with open(output_file, "w") as f:
+            f.write("""<!DOCTYPE html>
 <html><head><title>ECL Context Graph</title>
 <script src="https://d3js.org/d3.v7.min.js"></script>
-<style>body{{background:#1a1a2e;margin:0}} svg{{width:100%;height:100vh}}</style>
+<style>body{background:#1a1a2e;margin:0} svg{width:100%;height:100vh}</style>
 </head><body>
 <script>
-const nodes = {json.dumps(nodes_json)};
-const links = {json.dumps(edges_json)};
+const nodes = """)
+            json.dump(nodes_json, f)
+            f.write(";\nconst links = ")
+            json.dump(edges_json, f)
+            f.write(""";
 // D3 force-directed graph implementation
 const svg = d3.select("body").append("svg");
 const sim = d3.forceSimulation(nodes)
@@ -933,15 +1326,12 @@ const link = svg.selectAll("line").data(links).join("line").attr("stroke","#666"
 const node = svg.selectAll("circle").data(nodes).join("circle").attr("r",12).attr("fill","#4ECDC4");
 const label = svg.selectAll("text").data(nodes).join("text").text(d=>d.label)
   .attr("fill","white").attr("font-size","10px");
-sim.on("tick",()=>{{
+sim.on("tick",()=>{
   link.attr("x1",d=>d.source.x).attr("y1",d=>d.source.y).attr("x2",d=>d.target.x).attr("y2",d=>d.target.y);
   node.attr("cx",d=>d.x).attr("cy",d=>d.y);
   label.attr("x",d=>d.x+15).attr("y",d=>d.y+4);
-}});
-</script></body></html>"""
-
-        with open(output_file, "w") as f:
-            f.write(html)
+});
+</script></body></html>""")
         print(f"  Graph exported to {output_file} (D3.js fallback)")
         return output_file
 
@@ -953,6 +1343,9 @@ sim.on("tick",()=>{{
 class HealthcareExpert(BaseExpert):
     """Extracts patient-diagnosis-medication-doctor entities from clinical notes."""
 
+    sentinel_keywords = ('patient', 'medication', 'rx', 'drug', 'prescribed',
+                         'icd-10', 'dr', 'doctor')
+
     def __init__(self):
         super().__init__("HealthcareExpert")
 
@@ -960,7 +1353,7 @@ class HealthcareExpert(BaseExpert):
         result = ExtractionResult(expert_name=self.name)
 
         # Patient extraction
-        patients = re.findall(r'Patient[:\s]*([\w\s]+?)(?:\n|,|;)', text, re.IGNORECASE)
+        patients = _PATIENT_RE.findall(text)
         for p in patients:
             result.entities.append(Entity(
                 id=f"patient_{p.strip().lower().replace(' ', '_')}",
@@ -972,10 +1365,7 @@ class HealthcareExpert(BaseExpert):
             ))
 
         # Medication
-        meds = re.findall(
-            r'(?:Medication|Rx|Drug|Prescribed)[:\s]*([\w]+)\s*(?:dosage|dose)?[:\s]*(\d+\s*mg)?',
-            text, re.IGNORECASE
-        )
+        meds = _MED_RE.findall(text)
         for med_name, dosage in meds:
             result.entities.append(Entity(
                 id=f"medication_{med_name.lower()}",
@@ -987,7 +1377,7 @@ class HealthcareExpert(BaseExpert):
             ))
 
         # ICD-10 Diagnosis codes
-        diagnoses = re.findall(r'ICD-10[:\s]*([\w.]+)\s*\(([^)]+)\)', text, re.IGNORECASE)
+        diagnoses = _ICD_RE.findall(text)
         for code, desc in diagnoses:
             result.entities.append(Entity(
                 id=f"diagnosis_{code.lower().replace('.', '_')}",
@@ -999,7 +1389,7 @@ class HealthcareExpert(BaseExpert):
             ))
 
         # Doctor
-        doctors = re.findall(r'(?:Dr\.?|Doctor|Prescribed by)[:\s]*([\w\s.]+?)(?:\n|,|;|$)', text, re.IGNORECASE)
+        doctors = _DOCTOR_RE.findall(text)
         for doc in doctors:
             result.entities.append(Entity(
                 id=f"doctor_{doc.strip().lower().replace(' ', '_').replace('.', '')}",
@@ -1010,19 +1400,27 @@ class HealthcareExpert(BaseExpert):
                 confidence=0.90
             ))
 
-        # Build relationships
-        patient_ids = [e.id for e in result.entities if e.properties.get("role") == "patient"]
-        med_ids = [e.id for e in result.entities if e.type == EntityType.MEDICATION]
-        diag_ids = [e.id for e in result.entities if e.type == EntityType.DIAGNOSIS]
-        doc_ids = [e.id for e in result.entities if e.properties.get("role") == "doctor"]
-
-        for pid in patient_ids:
-            for mid in med_ids:
-                result.relationships.append(Relationship(pid, mid, RelationshipType.TAKES, confidence=0.90))
-            for did in diag_ids:
-                result.relationships.append(Relationship(pid, did, RelationshipType.HAS_DIAGNOSIS, confidence=0.95))
-            for drid in doc_ids:
-                result.relationships.append(Relationship(pid, drid, RelationshipType.PRESCRIBED_BY, confidence=0.88))
+        # Build relationships: partition ids in one pass over the entities,
+        # then emit each cross-product via a single extend — no per-append
+        # method lookups inside the O(patients × others) loops.
+        patient_ids, med_ids, diag_ids, doc_ids = [], [], [], []
+        for e in result.entities:
+            if e.type == EntityType.MEDICATION:
+                med_ids.append(e.id)
+            elif e.type == EntityType.DIAGNOSIS:
+                diag_ids.append(e.id)
+            elif e.properties.get("role") == "patient":
+                patient_ids.append(e.id)
+            elif e.properties.get("role") == "doctor":
+                doc_ids.append(e.id)
+
+        rels = result.relationships.extend
+        rels(Relationship(pid, mid, RelationshipType.TAKES, confidence=0.90)
+             for pid, mid in product(patient_ids, med_ids))
+        rels(Relationship(pid, did, RelationshipType.HAS_DIAGNOSIS, confidence=0.95)
+             for pid, did in product(patient_ids, diag_ids))
+        rels(Relationship(pid, drid, RelationshipType.PRESCRIBED_BY, confidence=0.88)
+             for pid, drid in product(patient_ids, doc_ids))
 
         result.reasoning = (
             f"Extracted {len(patients)} patients, {len(meds)} medications, "
@@ -1107,41 +1505,42 @@ def run_telecom_demo():
         source_expert="manual",
         confidence=1.0
     )
-    graph_builder.nodes[tower.id] = tower
+    graph_builder.add_node(tower)
 
     # Add extraction results
     graph_builder.add_extraction_results(results)
 
-    # Add tower relationships (tower-centric graph)
-    for entity in graph_builder.nodes.values():
-        if entity.type == EntityType.CONTRACT:
-            # Tower → Contract (HAS_CONTRACT)
-            graph_builder.edges.append(Relationship(
-                tower.id, entity.id, RelationshipType.HAS_CONTRACT, confidence=0.95
-            ))
-            # Contract → Company (WITH_CLIENT) if company exists
-            company_name = entity.properties.get('company', '')
-            if company_name:
-                company_id = f"company_{company_name.lower().replace(' ', '_')}"
-                if company_id in graph_builder.nodes:
-                    graph_builder.edges.append(Relationship(
-                        entity.id, company_id, RelationshipType.WITH_CLIENT, confidence=0.92
-                    ))
-        elif entity.type == EntityType.OPPORTUNITY:
-            # Tower → Opportunity
-            graph_builder.edges.append(Relationship(
-                tower.id, entity.id, RelationshipType.HAS_OPPORTUNITY, confidence=0.90
-            ))
-        elif entity.type == EntityType.RISK:
-            # Tower → Risk
-            graph_builder.edges.append(Relationship(
-                tower.id, entity.id, RelationshipType.HAS_RISK, confidence=0.90
-            ))
-        elif entity.type == EntityType.EQUIPMENT:
-            # Tower → Equipment (HAS_EQUIPMENT)
-            graph_builder.edges.append(Relationship(
-                tower.id, entity.id, RelationshipType.HAS_EQUIPMENT, confidence=0.88
-            ))
+    # Add tower relationships (tower-centric graph) — iterate the
+    # type-indexed lists instead of branching over every node
+    nodes_by_type = graph_builder.nodes_by_type
+    for entity in nodes_by_type[EntityType.CONTRACT]:
+        # Tower → Contract (HAS_CONTRACT)
+        graph_builder.edges.append(Relationship(
+            tower.id, entity.id, RelationshipType.HAS_CONTRACT, confidence=0.95
+        ))
+        # Contract → Company (WITH_CLIENT) if company exists
+        company_name = entity.properties.get('company', '')
+        if company_name:
+            company_id = f"company_{company_name.lower().replace(' ', '_')}"
+            if company_id in graph_builder.nodes:
+                graph_builder.edges.append(Relationship(
+                    entity.id, company_id, RelationshipType.WITH_CLIENT, confidence=0.92
+                ))
+    for entity in nodes_by_type[EntityType.OPPORTUNITY]:
+        # Tower → Opportunity
+        graph_builder.edges.append(Relationship(
+            tower.id, entity.id, RelationshipType.HAS_OPPORTUNITY, confidence=0.90
+        ))
+    for entity in nodes_by_type[EntityType.RISK]:
+        # Tower → Risk
+        graph_builder.edges.append(Relationship(
+            tower.id, entity.id, RelationshipType.HAS_RISK, confidence=0.90
+        ))
+    for entity in nodes_by_type[EntityType.EQUIPMENT]:
+        # Tower → Equipment (HAS_EQUIPMENT)
+        graph_builder.edges.append(Relationship(
+            tower.id, entity.id, RelationshipType.HAS_EQUIPMENT, confidence=0.88
+        ))
 
     print(f"  Total nodes: {len(graph_builder.nodes)}")
     print(f"  Total edges: {len(graph_builder.edges)}")
@@ -1152,11 +1551,11 @@ def run_telecom_demo():
     cypher = graph_builder.generate_cypher()
     print(cypher[:500] + "...\n")
 
-    # Save Cypher to file
+    # Save Cypher to file (query library streams straight to the file)
     with open("ecl_telecom_graph.cypher", "w") as f:
         f.write(cypher)
         f.write("\n\n")
-        f.write(graph_builder.generate_query_library())
+        graph_builder.generate_query_library(out=f)
     print("  Saved: ecl_telecom_graph.cypher")
 
     # --- Step 4: MCP Agent Interface ---
@@ -1183,9 +1582,10 @@ def run_telecom_demo():
     # --- Step 5: Visualization ---
     print("\n[STEP 5] Graph Visualization")
     print("-" * 40)
-    G = build_networkx_graph(graph_builder)
-    if G:
-        print(f"  NetworkX graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    # The demo only reports counts — no need to materialize a DiGraph.
+    summary = build_graph_summary(graph_builder)
+    print(f"  Graph summary: {summary['node_count']} nodes, "
+          f"{summary['edge_count']} edges")
 
     export_graph_html(graph_builder, "ecl_telecom_graph.html")
 
@@ -1241,10 +1641,9 @@ def run_healthcare_demo():
     # Build graph
     graph_builder = ContextGraphBuilder()
     graph_builder.add_extraction_results({"healthcare": result})
-    cypher = graph_builder.generate_cypher()
 
     with open("ecl_healthcare_graph.cypher", "w") as f:
-        f.write(cypher)
+        graph_builder.generate_cypher(out=f)
     print(f"\n  Saved: ecl_healthcare_graph.cypher")
 
     return graph_builder
@@ -8,19 +8,57 @@ Lyzr Criteria Addressed:
   - "Ability to reconstruct agent action"
 """
 
+import functools
 import json
 import hashlib
 import os
+import threading
 import time
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# Trace hashes are identity keys, not security material — xxh3 hashes at
+# memory bandwidth (~10-20x faster than SHA-256 on large documents).
+# Optional: falls back to hashlib when not installed.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# orjson serializes dataclass dicts to bytes directly; optional as usual.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NumPy partitions large confidence batches in one vectorized sweep.
+# Optional — small batches never touch it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # ============================================================
 # SECTION 1: TRACE DATA MODELS
 # ============================================================
 
+# Traces created in the same millisecond (one PipelineTrace plus N
+# ExtractionTraces per run) share one formatted timestamp instead of
+# paying for datetime.now().isoformat() N+1 times. Output stays ISO —
+# downstream code parses it with datetime.fromisoformat.
+_NOW_ISO_CACHE = [-1, ""]
+
+
+def _now_iso() -> str:
+    ms = time.time_ns() // 1_000_000
+    if ms != _NOW_ISO_CACHE[0]:
+        _NOW_ISO_CACHE[0] = ms
+        _NOW_ISO_CACHE[1] = datetime.now().isoformat()
+    return _NOW_ISO_CACHE[1]
+
+
 @dataclass
 class ExtractionTrace:
     """Traces a single expert's extraction run."""
@@ -48,7 +86,7 @@ class ExtractionTrace:
         if not self.trace_id:
             self.trace_id = f"trace_{int(time.time() * 1000)}_{self.expert_name}"
         if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = _now_iso()
 
 
 @dataclass
@@ -74,16 +112,25 @@ class PipelineTrace:
         if not self.pipeline_id:
             self.pipeline_id = f"pipeline_{int(time.time() * 1000)}"
         if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = _now_iso()
 
 
 # ============================================================
 # SECTION 2: TRACING UTILITIES
 # ============================================================
 
-def hash_text(text: str) -> str:
-    """SHA-256 hash of input text for audit reproducibility."""
-    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+def hash_text(text) -> str:
+    """Content hash of input text for audit reproducibility.
+
+    Accepts str or bytes — callers holding bytes (e.g. a raw POST body)
+    skip a redundant encode. Uses xxh3-64 when available (deterministic
+    across runs, so hashes stay stable as cache keys); otherwise
+    truncated SHA-256.
+    """
+    data = text if isinstance(text, bytes) else text.encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()[:16]
 
 
 def save_trace(trace, output_dir: str = "traces") -> str:
@@ -99,11 +146,17 @@ def save_trace(trace, output_dir: str = "traces") -> str:
 
     filepath = os.path.join(output_dir, filename)
 
-    # Convert dataclass to dict, handling nested dataclasses
-    trace_dict = asdict(trace)
-
-    with open(filepath, 'w') as f:
-        json.dump(trace_dict, f, indent=2, default=str)
+    if orjson is not None:
+        # orjson walks the dataclass tree natively — no intermediate
+        # asdict() copy. No default= callback either: trace fields are
+        # all native types (timestamps stored as ISO strings in
+        # __post_init__), so the encoder never leaves its fast path.
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(trace, option=orjson.OPT_INDENT_2))
+    else:
+        # Convert dataclass to dict, handling nested dataclasses
+        with open(filepath, 'w') as f:
+            json.dump(asdict(trace), f, indent=2, default=str)
 
     return filepath
 
@@ -114,6 +167,81 @@ def load_trace(filepath: str) -> Dict:
         return json.load(f)
 
 
+def _dumps_line(obj: Dict) -> bytes:
+    """Serialize one JSONL record (newline-terminated bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, default=str).encode('utf-8') + b'\n'
+
+
+def save_trace_jsonl(trace: PipelineTrace, output_dir: str = "traces") -> str:
+    """Append a pipeline trace to disk as JSONL.
+
+    One line per expert trace followed by a pipeline summary line, so each
+    write is O(one record) appended — no rewriting of a growing pretty-
+    printed JSON document as traces accumulate.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, f"{trace.pipeline_id}.jsonl")
+
+    # Join all records first so the whole pipeline lands in one write()
+    # syscall instead of N+1; the kernel batches the append into
+    # pagecache writeback.
+    lines = [_dumps_line({"kind": "expert_trace", **asdict(et)})
+             for et in trace.expert_traces]
+    summary = asdict(trace)
+    summary.pop("expert_traces", None)  # already written line-by-line
+    lines.append(_dumps_line({"kind": "pipeline_summary", **summary}))
+
+    with open(filepath, 'ab') as f:
+        f.write(b"".join(lines))
+
+    return filepath
+
+
+# Shared append-only trace log: one file, one lazily-opened O_APPEND
+# handle for the process, one write per trace. Cheaper than a file per
+# pipeline for high-throughput runs; the lock keeps concurrent handler
+# threads from interleaving records.
+_TRACE_LOG_LOCK = threading.Lock()
+_TRACE_LOG_HANDLES: Dict[str, Any] = {}
+
+
+def append_trace_log(trace: PipelineTrace,
+                     path: str = "traces/traces.jsonl") -> str:
+    """Append a pipeline trace to a shared JSONL log file.
+
+    Alternative to save_trace_jsonl's file-per-pipeline layout: all
+    traces share one log, the handle stays open across calls, and each
+    trace costs a single appending write().
+    """
+    record = asdict(trace)
+    record["kind"] = "pipeline_trace"
+    line = _dumps_line(record)
+    with _TRACE_LOG_LOCK:
+        f = _TRACE_LOG_HANDLES.get(path)
+        if f is None:
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            f = open(path, 'ab')
+            _TRACE_LOG_HANDLES[path] = f
+        f.write(line)
+        f.flush()
+    return path
+
+
+def load_trace_jsonl(filepath: str) -> List[Dict]:
+    """Load all records from a JSONL trace file."""
+    records = []
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if line.strip():
+                records.append(orjson.loads(line) if orjson is not None
+                               else json.loads(line))
+    return records
+
+
 def print_trace_summary(trace: PipelineTrace):
     """Print a human-readable trace summary to stdout."""
     print("\n" + "=" * 60)
@@ -155,7 +283,16 @@ def print_trace_summary(trace: PipelineTrace):
 # SECTION 3: ENTITY VALIDATION (HALLUCINATION GUARD)
 # ============================================================
 
-def validate_entity(entity, source_text: str) -> Dict[str, Any]:
+# Generic words carry no grounding signal; frozen once at module scope
+# instead of rebuilding the set on every validation call.
+_GENERIC_WORDS = frozenset({
+    "the", "and", "for", "with", "from", "contract", "equipment",
+    "risk", "opportunity", "tower", "company", "financial",
+    "medication", "diagnosis", "patient", "doctor",
+})
+
+
+def validate_entity(entity, source_text: str, source_lower: str = None) -> Dict[str, Any]:
     """
     Validate an extracted entity against the source text.
     Returns validation result with reason if invalid.
@@ -164,6 +301,9 @@ def validate_entity(entity, source_text: str) -> Dict[str, Any]:
     1. Entity name is present in (or derivable from) source text
     2. Entity ID is non-empty
     3. Required properties are present
+
+    Pass a precomputed source_lower when validating many entities against
+    the same text (see validate_entities_batch).
     """
     result = {"valid": True, "reasons": []}
 
@@ -180,15 +320,12 @@ def validate_entity(entity, source_text: str) -> Dict[str, Any]:
     # Check 3: Name derivable from source text (fuzzy)
     if entity.name and source_text:
         name_lower = entity.name.lower().strip()
-        source_lower = source_text.lower()
+        if source_lower is None:
+            source_lower = source_text.lower()
 
         # Check if any significant word (3+ chars) from entity name appears in source
-        name_words = [w for w in name_lower.split() if len(w) >= 3]
-        # Filter out generic words
-        generic_words = {"the", "and", "for", "with", "from", "contract", "equipment",
-                         "risk", "opportunity", "tower", "company", "financial",
-                         "medication", "diagnosis", "patient", "doctor"}
-        meaningful_words = [w for w in name_words if w not in generic_words]
+        meaningful_words = [w for w in name_lower.split()
+                            if len(w) >= 3 and w not in _GENERIC_WORDS]
 
         if meaningful_words:
             found = any(w in source_lower for w in meaningful_words)
@@ -209,6 +346,18 @@ def validate_entity(entity, source_text: str) -> Dict[str, Any]:
     return result
 
 
+def validate_entities_batch(entities, source_text: str) -> List[Dict[str, Any]]:
+    """
+    Validate many entities against the same source text.
+
+    Lowercases the source once instead of once per entity — the grounding
+    check is a memory-bound scan of the document, so the per-entity
+    str.lower() copies were the dominant cost for large extractions.
+    """
+    source_lower = source_text.lower() if source_text else ""
+    return [validate_entity(e, source_text, source_lower) for e in entities]
+
+
 # ============================================================
 # SECTION 4: CONFIDENCE GUARDRAILS
 # ============================================================
@@ -220,16 +369,34 @@ def apply_confidence_filter(entities: list, min_confidence: float = MIN_CONFIDEN
     Filter entities by confidence score.
     Returns (accepted_entities, rejected_entities).
     """
-    accepted = []
-    rejected = []
-
-    for entity in entities:
-        if entity.confidence >= min_confidence:
-            accepted.append(entity)
-        else:
-            rejected.append(entity)
-            print(f"    ⚡ [GUARDRAIL] Rejected '{entity.name}' "
-                  f"(confidence={entity.confidence:.2f} < {min_confidence})")
+    # Threshold <= 0 can't reject anything — skip the partition walk.
+    if min_confidence <= 0.0 or not entities:
+        return entities, []
+
+    if np is not None and len(entities) >= 256:
+        # One SIMD comparison over a contiguous float array beats the
+        # interpreter loop once batches reach the hundreds.
+        confs = np.fromiter((e.confidence for e in entities),
+                            dtype=np.float64, count=len(entities))
+        mask = confs >= min_confidence
+        accepted = [entities[i] for i in np.nonzero(mask)[0]]
+        rejected = [entities[i] for i in np.nonzero(~mask)[0]]
+    else:
+        accepted = []
+        rejected = []
+        for entity in entities:
+            if entity.confidence >= min_confidence:
+                accepted.append(entity)
+            else:
+                rejected.append(entity)
+
+    # One print for the whole batch — a per-entity print (format + flush)
+    # costs more than the comparisons it reports on.
+    if rejected:
+        print("\n".join(
+            f"    ⚡ [GUARDRAIL] Rejected '{e.name}' "
+            f"(confidence={e.confidence:.2f} < {min_confidence})"
+            for e in rejected))
 
     return accepted, rejected
 
@@ -252,7 +419,12 @@ PROMPT_VERSIONS = {
     "LLMHealthcareExpert.extraction": "v1.0.0",
 }
 
+@functools.lru_cache(maxsize=64)
 def get_prompt_version(expert_name: str, prompt_type: str = "extraction") -> str:
-    """Get the version string for an expert's prompt."""
+    """Get the version string for an expert's prompt.
+
+    Cached: the version table is fixed at import time and this is called
+    per expert per trace, so hits skip the f-string key build entirely.
+    """
     key = f"{expert_name}.{prompt_type}"
     return PROMPT_VERSIONS.get(key, "v0.0.0-unversioned")
@@ -7,10 +7,16 @@ Tests: tracing, confidence guardrails, hallucination guard, timing,
 Run: python3 test_ecl.py
 """
 
+import functools
+import io
 import sys
 import os
 import json
+import threading
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Ensure ECL directory is in path
@@ -26,16 +32,24 @@ class TestResult:
         self.passed = 0
         self.failed = 0
         self.errors = []
+        # Tests run on worker threads; the lock keeps concurrent
+        # ok()/fail() counter updates from racing.
+        self._lock = threading.Lock()
 
     def ok(self, name):
-        self.passed += 1
+        with self._lock:
+            self.passed += 1
         print(f"  ✓ {name}")
 
     def fail(self, name, reason=""):
-        self.failed += 1
-        self.errors.append((name, reason))
+        with self._lock:
+            self.failed += 1
+            self.errors.append((name, reason))
         print(f"  ✗ {name}: {reason}")
 
+    def skip(self, name, reason=""):
+        print(f"  ○ {name} (skipped: {reason})")
+
     def summary(self):
         total = self.passed + self.failed
         print(f"\n{'='*60}")
@@ -50,6 +64,37 @@ class TestResult:
 
 results = TestResult()
 
+OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+
+
+@functools.cache
+def ollama_ready(model: str) -> bool:
+    """Probe the Ollama daemon once per model and pin the model warm.
+
+    A short /api/tags GET decides availability; on success an empty
+    generate with keep_alive pre-loads the model so the first real
+    LLM assertion doesn't eat the multi-second cold start. Cached, so
+    every test after the first pays nothing.
+    """
+    try:
+        with urllib.request.urlopen(f"{OLLAMA_HOST}/api/tags", timeout=1) as r:
+            if r.status != 200:
+                return False
+    except (urllib.error.URLError, TimeoutError, OSError):
+        return False
+    try:
+        preload = json.dumps({
+            "model": model, "prompt": "", "keep_alive": "10m",
+            "options": {"num_thread": os.cpu_count()},
+        }).encode("utf-8")
+        req = urllib.request.Request(
+            f"{OLLAMA_HOST}/api/generate", data=preload,
+            headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(req, timeout=30).read()
+    except (urllib.error.URLError, TimeoutError, OSError):
+        return False
+    return True
+
 
 # ============================================================
 # TEST 1: ecl_tracing.py
@@ -343,30 +388,104 @@ def test_llm_module():
     assert client.model == "llama3:8b"
     results.ok("OllamaClient creation")
 
+    # Batch embedding: one POST per batch; degrades to None offline
+    assert callable(client.embed_batch)
+    assert client.embed_batch([]) is None
+    results.ok("embed_batch API (no-op on empty/offline)")
+
     # Test Orchestrator creation
     orch = LLMMoEOrchestrator(model="llama3:8b")
     assert len(orch.experts) == 4
     assert orch.last_pipeline_trace is None
     results.ok("LLMMoEOrchestrator has 4 experts + trace attribute")
 
+    # Live round trip only when the daemon is up and the model is
+    # pre-warmed by ollama_ready; otherwise skip instead of timing out
+    if ollama_ready("llama3:8b"):
+        reply = client.generate("Reply with the word ok.", format_json=False)
+        assert reply is not None and reply.get("text")
+        results.ok("Live Ollama generate round trip")
+    else:
+        results.skip("Live Ollama generate round trip", "Ollama not running")
+
+    # Fused mode routes to one expert; extract_all takes the inline
+    # fast path for it (no thread-pool fan-out or aggregation pass)
+    fused = LLMMoEOrchestrator(model="llama3:8b", fused=True)
+    assert len(fused.experts) == 1
+    results.ok("Fused orchestrator single-expert fast path")
+
+    # reset() clears per-run state without rebuilding the expert list,
+    # so cached orchestrator instances can be reused across runs
+    experts_before = orch.experts
+    orch.last_pipeline_trace = object()
+    orch.reset()
+    assert orch.last_pipeline_trace is None
+    assert orch.experts is experts_before
+    results.ok("reset() clears trace, keeps experts")
+
 
 # ============================================================
 # MAIN
 # ============================================================
 
+class _ThreadLocalStdout:
+    """Routes print() to a per-thread buffer so parallel tests don't
+    interleave their output. Threads without a buffer (e.g. the main
+    thread) write straight through to the real stdout.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def set_buffer(self, buf):
+        self._local.buf = buf
+
+    def write(self, s):
+        return getattr(self._local, 'buf', self._real).write(s)
+
+    def flush(self):
+        getattr(self._local, 'buf', self._real).flush()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("  ECL Test Suite")
     print(f"  {datetime.now().isoformat()}")
     print("=" * 60)
 
-    test_tracing()
-    test_entity_validation()
-    test_confidence_guardrails()
-    test_connectors()
-    test_governance()
-    test_base_types()
-    test_llm_module()
+    tests = [
+        test_tracing,
+        test_entity_validation,
+        test_confidence_guardrails,
+        test_connectors,
+        test_governance,
+        test_base_types,
+        test_llm_module,
+    ]
+
+    # Run the tests concurrently — they're dominated by imports and
+    # file I/O, not bytecode, so threads overlap the waiting and wall
+    # time drops toward max(test) instead of sum(test). Each test's
+    # prints land in its own buffer and are flushed in submission order
+    # so the banner output stays deterministic.
+    buffers = [io.StringIO() for _ in tests]
+    real_stdout = sys.stdout
+    sys.stdout = tl_stdout = _ThreadLocalStdout(real_stdout)
+
+    def _run(test_fn, buf):
+        tl_stdout.set_buffer(buf)
+        test_fn()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            list(ex.map(_run, tests, buffers))
+    finally:
+        sys.stdout = real_stdout
+        # One write for the whole suite's output — O(1) stdout syscalls
+        # instead of one per assertion line.
+        sys.stdout.write("".join(buf.getvalue() for buf in buffers))
+        sys.stdout.flush()
 
     success = results.summary()
     sys.exit(0 if success else 1)